@@ -0,0 +1,12 @@
+"""
+Scenarios for load runs (run_load_tests.py and the `load` marker).
+Each scenario is called as scenario(api_utility, base_url) and returns the final Response.
+"""
+
+
+def get_root(api_utility, base_url):
+    return api_utility.get(base_url.rstrip("/") + "/")
+
+
+def get_products(api_utility, base_url):
+    return api_utility.get(base_url.rstrip("/") + "/products")
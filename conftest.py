@@ -1,10 +1,24 @@
+import glob
+import json
 import os
+import time
 import pytest
 import yaml
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from utils.driver_pool_utility import DriverPoolUtility
+from utils.browser_context_utility import BrowserContextUtility
+from utils.logger_utility import logger
+from utils.screenshot_utility import ScreenshotUtility
+from utils.report_utility import ReportUtility
+from utils.driver_profiler_utility import DriverProfilerUtility
+from utils.grid_connection_utility import GridConnectionUtility
+from utils.duration_scheduler_utility import DurationSchedulerUtility
+from utils.api_utility import APIUtility
+from utils.database_utility import DatabaseUtility
+from utils.query_profiler_utility import QueryProfilerUtility
+from utils.load_test_utility import LoadTestUtility
 
 def load_config():
     config_path = os.path.join(os.path.dirname(__file__), "config", "config.yaml")
@@ -34,38 +48,80 @@ def pytest_addoption(parser):
     parser.addoption("--headless", action="store_true", default=False, help="Run browsers in headless mode.")
     parser.addoption("--environment", action="store", default=None, help="Specify the environment (dev, qa, staging, prod).")
     parser.addoption("--grid", action="store_true", default=False, help="Run tests using Selenium Grid.")
+    parser.addoption("--driver-mode", action="store", default=None, choices=["pool", "fresh", "context"],
+                     help="WebDriver lifecycle: reuse sessions per worker (pool), launch one per test (fresh) "
+                          "or give each test an isolated context in one Chrome per worker (context).")
+    parser.addoption("--max-reuse", action="store", type=int, default=None,
+                     help="Number of tests a pooled WebDriver session serves before it is replaced (0 = unlimited).")
+    parser.addoption("--warm-spares", action="store", type=int, default=None,
+                     help="Number of spare WebDriver sessions each worker launches in the background ahead of demand.")
+    parser.addoption("--profile-driver", action="store_true", default=False,
+                     help="Record WebDriver commands per test and write a driver profile report.")
+    parser.addoption("--schedule-by-duration", action="store_true", default=False,
+                     help="Assign tests to xdist workers longest-first using stored durations "
+                          "(applies with -n and --dist loadgroup).")
+    parser.addoption("--update-load-baseline", action="store_true", default=False,
+                     help="Store results of @pytest.mark.load tests as their new baselines.")
+    parser.addoption("--profile-db", action="store_true", default=False,
+                     help="Record DatabaseUtility statements and write a slow-query report.")
+    parser.addoption("--no-db-isolation", action="store_true", default=False,
+                     help="Let db-marked tests commit instead of rolling back their transaction at teardown.")
+    parser.addoption("--report-level", action="store", default=None, choices=list(ReportUtility.LEVELS),
+                     help="Allure instrumentation of the utilities: off, failures, steps or full.")
 
 @pytest.fixture(scope="session")
 def config():
     return load_config()
 
-@pytest.fixture(scope="function")
-def init_driver(request, config):
-    cli_env = request.config.getoption("--environment")
-    cli_headless = request.config.getoption("--headless")
-    use_grid = request.config.getoption("--grid")
+def get_driver_settings(pytest_config, config):
+    """
+    Resolve browser settings from CLI options, falling back to config.yaml.
+    """
+    cli_env = pytest_config.getoption("--environment")
+    cli_headless = pytest_config.getoption("--headless")
+    cli_mode = pytest_config.getoption("--driver-mode")
+    cli_max_reuse = pytest_config.getoption("--max-reuse")
+    cli_spares = pytest_config.getoption("--warm-spares")
 
     environment = cli_env if cli_env else config.get("environment", "dev")
-    urls = config.get("urls", {})
-    base_url = urls.get(environment)
+    pool_config = config.get("driver_pool", {}) or {}
     browser = config.get("browser", "chrome")
-    headless = cli_headless if cli_headless is not None else config.get("headless", False)
+    use_grid = pytest_config.getoption("--grid")
+    driver_mode = cli_mode if cli_mode else config.get("driver_mode", "fresh")
+    if driver_mode == "context" and (browser != "chrome" or use_grid):
+        # Isolated contexts rely on local ChromeDriver's DevTools bridge.
+        logger.warning("driver_mode 'context' needs local Chrome, falling back to 'pool'.")
+        driver_mode = "pool"
+    return {
+        "base_url": config.get("urls", {}).get(environment),
+        "browser": browser,
+        "headless": cli_headless if cli_headless is not None else config.get("headless", False),
+        "use_grid": use_grid,
+        "grid_url": config.get("grid_url", "http://localhost:4444/wd/hub"),
+        "driver_mode": driver_mode,
+        "max_reuse": cli_max_reuse if cli_max_reuse is not None else pool_config.get("max_reuse", 25),
+        "spares": cli_spares if cli_spares is not None else pool_config.get("spares", 0),
+    }
 
-    driver = None
+def create_driver(settings):
+    browser = settings["browser"]
+    headless = settings["headless"]
 
-    if use_grid:
-        grid_url = config.get("grid_url", "http://localhost:4444/wd/hub")
+    if settings["use_grid"]:
+        grid_url = settings["grid_url"]
         if browser == "chrome":
             options = get_chrome_options(headless)
-            capabilities = DesiredCapabilities.CHROME.copy()
-            capabilities["goog:chromeOptions"] = {"args": options.arguments}
         elif browser == "firefox":
             options = get_firefox_options(headless)
-            capabilities = DesiredCapabilities.FIREFOX.copy()
-            capabilities["moz:firefoxOptions"] = {"args": options.arguments}
         else:
             raise ValueError(f"Unsupported browser for Grid: {browser}")
-        driver = webdriver.Remote(command_executor=grid_url, desired_capabilities=capabilities)
+        GridConnectionUtility.wait_until_ready()
+        driver = webdriver.Remote(
+            command_executor=grid_url,
+            options=options,
+            client_config=GridConnectionUtility.client_config(grid_url),
+        )
+        GridConnectionUtility.attach(driver)
     else:
         if browser == "chrome":
             driver = webdriver.Chrome(options=get_chrome_options(headless))
@@ -74,32 +130,375 @@ def init_driver(request, config):
         else:
             raise ValueError(f"Unsupported browser: {browser}")
 
-    driver.implicitly_wait(10)
+    # No implicit wait: WebUtility's wait engine owns all waiting, so negative checks return fast.
     driver.maximize_window()
 
+    if settings["base_url"]:
+        driver.get(settings["base_url"])
+    return driver
+
+def build_driver_pool(pytest_config, config):
+    """
+    Create the process's driver pool; warm spares (pool mode only) start launching immediately.
+    """
+    settings = get_driver_settings(pytest_config, config)
+    return DriverPoolUtility(
+        factory=lambda: create_driver(settings),
+        base_url=settings["base_url"],
+        max_reuse=settings["max_reuse"],
+        spares=settings["spares"] if settings["driver_mode"] == "pool" else 0,
+    )
+
+@pytest.fixture(scope="session")
+def driver_pool(request, config):
+    """
+    One pool per process, i.e. per xdist worker. Sessions are only launched on first use, unless
+    warm spares are configured: then the pool is created once collection is final (see
+    pytest_collection_finish) so they launch while the first tests are set up.
+    """
+    pool = getattr(request.config, "driver_pool", None)
+    if pool is not None:
+        yield pool  # closed in pytest_sessionfinish
+        return
+    pool = build_driver_pool(request.config, config)
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def browser_contexts(request, config):
+    """
+    One shared Chrome per process for driver_mode 'context'. Launched on first use.
+    """
+    settings = get_driver_settings(request.config, config)
+    contexts = BrowserContextUtility(
+        factory=lambda: create_driver(dict(settings, base_url=None)),
+        base_url=settings["base_url"],
+    )
+    yield contexts
+    contexts.close()
+
+@pytest.fixture(scope="function")
+def init_driver(request, config, driver_pool, browser_contexts):
+    settings = get_driver_settings(request.config, config)
+    mode = settings["driver_mode"]
+
+    if mode == "pool":
+        driver = driver_pool.acquire()
+    elif mode == "context":
+        driver = browser_contexts.open_context()
+        context_id = browser_contexts.context_id
+    else:
+        driver = create_driver(settings)
+
+    profiler = getattr(request.config, "driver_profiler", None)
+    if profiler:
+        profiler.instrument(driver)
+
     # Attach driver to test instance if using class-based tests
     if hasattr(request.node, "cls"):
         request.node.cls.driver = driver
 
-    if base_url:
-        driver.get(base_url)
-
     yield driver
-    driver.quit()
+    if mode == "pool":
+        driver_pool.release(driver)
+    elif mode == "context":
+        browser_contexts.close_context(driver, context_id)
+    else:
+        driver.quit()
+
+def get_db_settings(pytest_config, config):
+    """
+    Resolve the database connection string and type for the selected environment.
+    """
+    environment = pytest_config.getoption("--environment") or config.get("environment", "dev")
+    return {
+        "connection_string": config.get("db_connection", {}).get(environment),
+        "db_type": config.get("db_type", "postgres"),
+    }
+
+@pytest.fixture(scope="session")
+def db_pool(request, config):
+    """
+    Connection pool for the environment's database, one per process (xdist worker).
+    """
+    settings = get_db_settings(request.config, config)
+    pool = DatabaseUtility.pool_for(settings["connection_string"], settings["db_type"])
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="function", autouse=True)
+def db_isolation(request, config):
+    """
+    Runs each db-marked test in a transaction on a pooled connection and rolls it back at teardown.
+    DatabaseUtility instances in the test share that connection and skip commits. The connection
+    is checked out when the test first connects, so db-marked tests that never do cost nothing.
+    """
+    enabled = (config.get("db_isolation", {}) or {}).get("enabled", True)
+    if request.node.get_closest_marker("db") is None or not enabled or request.config.getoption("--no-db-isolation"):
+        yield None
+        return
+    settings = get_db_settings(request.config, config)
+    with DatabaseUtility.transaction_scope(settings["connection_string"], settings["db_type"], lazy=True):
+        yield
+
+@pytest.fixture(scope="function")
+def db(request, config, db_pool, db_isolation):
+    """
+    DatabaseUtility connected through the worker's pool; the connection is reset and returned after the test.
+    """
+    settings = get_db_settings(request.config, config)
+    with DatabaseUtility(settings["connection_string"], settings["db_type"], pool=db_pool) as database:
+        yield database
+
+@pytest.fixture(scope="function")
+def load_test(request, config):
+    """
+    Runner for @pytest.mark.load(concurrency=..., duration=..., rate=..., warmup=..., tolerance=...) tests.
+    Call it with a scenario and base URL; the test fails if the run regresses against its baseline.
+    """
+    load_config_section = config.get("load_testing", {}) or {}
+    marker = request.node.get_closest_marker("load")
+    options = dict(marker.kwargs) if marker else {}
+    tolerance = options.pop("tolerance", load_config_section.get("tolerance", 0.1))
+    name = ScreenshotUtility.sanitize_name(request.node.nodeid)
+
+    def run(scenario, base_url):
+        summary = LoadTestUtility(
+            scenario,
+            base_url,
+            concurrency=options.get("concurrency", load_config_section.get("concurrency", 10)),
+            duration=options.get("duration", load_config_section.get("duration", 10)),
+            rate=options.get("rate"),
+            warmup=options.get("warmup", load_config_section.get("warmup", 1)),
+        ).run()
+        for line in LoadTestUtility.format_summary(summary):
+            logger.info("Load %s: %s", name, line)
+        regressions = LoadTestUtility.evaluate(
+            summary,
+            results_path=os.path.join(load_config_section.get("results_dir", "reports/load"), f"{name}.json"),
+            baseline_path=os.path.join(load_config_section.get("baseline_dir", "baselines/load"), f"{name}.json"),
+            tolerance=tolerance,
+            update_baseline=request.config.getoption("--update-load-baseline"),
+        )
+        if regressions:
+            pytest.fail(f"Load regression: {'; '.join(regressions)}")
+        return summary
+    return run
+
+def pytest_configure(config):
+    settings = load_config()
+    report_config = settings.get("reporting", {}) or {}
+    ReportUtility.configure(
+        level=config.getoption("--report-level") or report_config.get("level", "steps"),
+        max_attachment_size=report_config.get("max_attachment_size"),
+        spill_dir=report_config.get("spill_dir"),
+    )
+
+    grid_connection_config = settings.get("grid_connection", {}) or {}
+    GridConnectionUtility.configure(
+        pool_size=grid_connection_config.get("pool_size"),
+        timeout=grid_connection_config.get("timeout"),
+        retries=grid_connection_config.get("retries"),
+        ready_timeout=grid_connection_config.get("ready_timeout"),
+    )
+
+    api_connection_config = settings.get("api_connection", {}) or {}
+    APIUtility.configure(
+        pool_size=api_connection_config.get("pool_size"),
+        retries=api_connection_config.get("retries"),
+        backoff_factor=api_connection_config.get("backoff_factor"),
+        timeout=api_connection_config.get("timeout"),
+        stream_dir=api_connection_config.get("stream_dir"),
+        chunk_size=api_connection_config.get("chunk_size"),
+    )
+
+    db_fetch_config = settings.get("db_fetch", {}) or {}
+    DatabaseUtility.configure(
+        batch_size=db_fetch_config.get("batch_size"),
+        log_sample_rows=db_fetch_config.get("log_sample_rows"),
+        bulk_chunk_size=db_fetch_config.get("bulk_chunk_size"),
+    )
+    db_pool_config = settings.get("db_pool", {}) or {}
+    DatabaseUtility.configure_pool(
+        enabled=db_pool_config.get("enabled", True),
+        min_size=db_pool_config.get("min_size"),
+        max_size=db_pool_config.get("max_size"),
+        max_lifetime=db_pool_config.get("max_lifetime"),
+        health_check=db_pool_config.get("health_check"),
+        checkout_timeout=db_pool_config.get("checkout_timeout"),
+    )
+
+    db_profiling_config = settings.get("db_profiling", {}) or {}
+    config.query_profiler = None
+    if config.getoption("--profile-db") or db_profiling_config.get("enabled", False):
+        config.query_profiler = QueryProfilerUtility(
+            output_dir=db_profiling_config.get("output_dir", os.path.join("reports", "db_profile")),
+            slow_threshold=db_profiling_config.get("slow_threshold", 0.5),
+            explain=db_profiling_config.get("explain", True),
+        )
+        DatabaseUtility.profiler = config.query_profiler
+        if not hasattr(config, "workerinput"):
+            for stale in glob.glob(os.path.join(config.query_profiler.output_dir, "*.json")):
+                os.remove(stale)
+
+    screenshot_config = settings.get("screenshots", {}) or {}
+    config.screenshot_utility = ScreenshotUtility(
+        directory=screenshot_config.get("directory", "screenshot"),
+        image_format=screenshot_config.get("format", "png"),
+        max_width=screenshot_config.get("max_width"),
+        quality=screenshot_config.get("quality", 80),
+    )
+
+    scheduling_config = settings.get("scheduling", {}) or {}
+    config.duration_scheduler = None
+    if config.getoption("--schedule-by-duration") or scheduling_config.get("enabled", False):
+        config.duration_scheduler = DurationSchedulerUtility(scheduling_config.get("timings_file", ".test_timings.json"))
+        config.session_started = time.monotonic()
+
+    config.driver_profiler = None
+    if config.getoption("--profile-driver"):
+        config.driver_profiler = DriverProfilerUtility()
+        if not hasattr(config, "workerinput"):
+            # Controller: drop per-worker files from a previous run before workers start.
+            for stale in glob.glob(os.path.join(config.driver_profiler.output_dir, "*.json")):
+                os.remove(stale)
+
+BROWSER_FIXTURES = {"init_driver", "driver_pool", "browser_contexts"}
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Workers always see dist "no"; pass the controller's mode so they know whether groups apply.
+    node.workerinput["dist"] = node.config.getoption("dist")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    scheduler = config.duration_scheduler
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    dist = getattr(config, "workerinput", {}).get("dist")
+    if scheduler is not None and workers > 1 and dist == "loadgroup":
+        # Runs identically on every xdist worker, so all workers build the same plan. Must run
+        # before xdist's own hook, which turns xdist_group markers into node id suffixes.
+        # Other dist modes keep xdist's dynamic scheduling; timings are still recorded.
+        assignment, loads = scheduler.plan([item.nodeid for item in items], workers)
+        items.sort(key=lambda item: -scheduler.estimate(item.nodeid))
+        for item in items:
+            item.add_marker(pytest.mark.xdist_group(name=scheduler.group_name(assignment[item.nodeid])))
+        logger.debug("Duration schedule loads per worker: %s", loads)
+    if GridConnectionUtility.ready_file():
+        # The grid is still booting: run tests that need no browser (API, DB) first.
+        items.sort(key=lambda item: bool(BROWSER_FIXTURES & set(item.fixturenames)))
+
+def pytest_collection_finish(session):
+    # After -m/-k deselection, so warm spares only launch when a browser test will actually run.
+    config = session.config
+    settings = load_config()
+    driver_settings = get_driver_settings(config, settings)
+    if (driver_settings["driver_mode"] == "pool" and driver_settings["spares"] and not config.getoption("collectonly")
+            and any(BROWSER_FIXTURES & set(item.fixturenames) for item in session.items)):
+        config.driver_pool = build_driver_pool(config, settings)
+
+def pytest_unconfigure(config):
+    screenshot_utility = getattr(config, "screenshot_utility", None)
+    if screenshot_utility:
+        screenshot_utility.close()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    profiler = item.config.driver_profiler
+    if profiler is None:
+        yield
+        return
+    profiler.begin_test(item.nodeid)
+    try:
+        yield
+    finally:
+        item.driver_profile = profiler.end_test()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    # Covers setup and teardown too, so fixture queries are attributed to the test.
+    query_profiler = item.config.query_profiler
+    if query_profiler:
+        query_profiler.current_test = DurationSchedulerUtility.base_nodeid(item.nodeid)
+    yield
+    if query_profiler:
+        query_profiler.current_test = None
+
+def pytest_sessionfinish(session):
+    driver_pool = getattr(session.config, "driver_pool", None)
+    if driver_pool:
+        driver_pool.close()
+    GridConnectionUtility.close()
+    APIUtility.close()
+    DatabaseUtility.close_pools()
+    scheduler = session.config.duration_scheduler
+    if scheduler and not hasattr(session.config, "workerinput"):
+        busy_by_worker = {}
+        reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+        for reports in (reporter.stats.values() if reporter else []):
+            for report in reports:
+                if isinstance(report, pytest.TestReport):
+                    scheduler.record(report.nodeid, report.duration)
+                    node = getattr(report, "node", None)
+                    worker = node.workerinput["workerid"] if node is not None else "main"
+                    busy_by_worker[worker] = busy_by_worker.get(worker, 0.0) + report.duration
+        workers = session.config.getoption("numprocesses", default=None) or 1
+        scheduler.summarize(workers, busy_by_worker, time.monotonic() - session.config.session_started)
+        scheduler.save()
+    profiler = session.config.driver_profiler
+    if profiler:
+        workerinput = getattr(session.config, "workerinput", None)
+        profiler.write(workerinput["workerid"] if workerinput else "main")
+    query_profiler = session.config.query_profiler
+    if query_profiler:
+        workerinput = getattr(session.config, "workerinput", None)
+        query_profiler.write(workerinput["workerid"] if workerinput else "main")
 
-@pytest.fixture(scope="session", autouse=True)
-def create_screenshot_dir():
-    if not os.path.exists("screenshot"):
-        os.makedirs("screenshot")
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    query_profiler = config.query_profiler
+    if query_profiler:
+        merged = QueryProfilerUtility.merge(query_profiler.output_dir)
+        summary_path = os.path.join(os.path.dirname(query_profiler.output_dir), "db_profile.json")
+        with open(summary_path, "w") as f:
+            json.dump(merged, f, indent=2)
+        terminalreporter.write_sep("=", "Database statement profile")
+        for line in QueryProfilerUtility.format_table(merged):
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"{len(merged['slowest'])} slow execution(s); full profile: {summary_path}")
+    profiler = config.driver_profiler
+    if profiler is None:
+        return
+    merged = DriverProfilerUtility.merge(profiler.output_dir)
+    summary_path = os.path.join(os.path.dirname(profiler.output_dir), "driver_profile.json")
+    with open(summary_path, "w") as f:
+        json.dump(merged, f, indent=2)
+    terminalreporter.write_sep("=", "WebDriver command profile")
+    for line in DriverProfilerUtility.format_table(merged):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Full profile: {summary_path}")
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
+    budget = item.get_closest_marker("driver_budget")
+    if rep.when == "call" and budget and hasattr(item, "driver_profile"):
+        violations = DriverProfilerUtility.check_budget(
+            item.driver_profile,
+            max_commands=budget.kwargs.get("max_commands"),
+            max_seconds=budget.kwargs.get("max_seconds"),
+        )
+        if violations and rep.passed:
+            message = f"Driver budget exceeded: {'; '.join(violations)}"
+            if budget.kwargs.get("action", "fail") == "fail":
+                rep.outcome = "failed"
+                rep.longrepr = message
+            else:
+                item.warn(pytest.PytestWarning(message))
     if rep.when == "call" and rep.failed:
-        driver = getattr(item.instance, "driver", None)
+        driver = getattr(item.instance, "driver", None) or getattr(item, "funcargs", {}).get("init_driver")
         if driver:
             test_case = item.parent.name if hasattr(item, "parent") else "unknown_case"
-            test_step = item.name
-            filename = f"screenshot/{test_case}_{test_step}.png"
-            driver.save_screenshot(filename)
\ No newline at end of file
+            item.config.screenshot_utility.capture(driver, f"{test_case}_{item.name}")
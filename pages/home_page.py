@@ -57,14 +57,11 @@ class HomePage(BasePage, HomePageLocators):
             bool: True if the default sorting is as expected, False otherwise.
         """
         # Placeholder for actual sorting validation logic
-        titles = self.web_utility.find_elements(self.PRODUCT_TITLE)
-        if not titles:
+        title_lst = self.web_utility.get_texts(self.PRODUCT_TITLE)
+        if not title_lst:
             self.logger.error("No product titles found on the home page.")
             return False    
         # Example logic: Check if titles are sorted alphabetically
-        title_lst = []
-        for title in titles:
-            title_lst.append(self.web_utility.get_text_elements(title))
         if title_lst != sorted(title_lst):
             self.logger.error("Product titles are not sorted as expected.")
             return False    
@@ -89,9 +86,9 @@ class HomePage(BasePage, HomePageLocators):
         """
         actual_product_title = self.web_utility.get_text(self.SEARCHE_PRODUCT_TITLE)
         if expected_product.lower() in actual_product_title.lower():
-            self.logger.info(f"Product '{expected_product}' found in search results.")
+            self.logger.info("Product '%s' found in search results.", expected_product)
             return True 
         else:
-            self.logger.error(f"Product '{expected_product}' not found in search results. Found: {actual_product_title}")
+            self.logger.error("Product '%s' not found in search results. Found: %s", expected_product, actual_product_title)
             return False
         
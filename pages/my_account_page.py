@@ -78,9 +78,10 @@ class MyAccountPage(BasePage,MyAccountPageLocators):
             email (str): The email to register.
             password (str): The password to register.
         """
-        self.enter_register_email(email)
-        self.enter_register_password(password)
-        self.click_register_button()
+        self.web_utility.fill_form({
+            self.REGISTER_EMAIL_TEXT_FIELD: email,
+            self.REGISTER_PASSWORD_TEXT_FIELD: password,
+        }, submit=self.REGISTER_BUTTON)
 
     def login_user(self, username, password):
         """
@@ -89,9 +90,10 @@ class MyAccountPage(BasePage,MyAccountPageLocators):
             username (str): The username to log in.
             password (str): The password to log in.
         """
-        self.enter_username(username)
-        self.enter_password(password)
-        self.click_login_button()
+        self.web_utility.fill_form({
+            self.USERNAME_TEXT_FIELD: username,
+            self.PASSWORD_TEXT_FIELD: password,
+        }, submit=self.LOGIN_BUTTON)
 
     def login_with_remember_me(self, username, password):
         """
@@ -100,10 +102,11 @@ class MyAccountPage(BasePage,MyAccountPageLocators):
             username (str): The username to log in.
             password (str): The password to log in.
         """
-        self.enter_username(username)
-        self.enter_password(password)
-        self.click_remember_me_checkbox()
-        self.click_login_button() 
+        self.web_utility.fill_form({
+            self.USERNAME_TEXT_FIELD: username,
+            self.PASSWORD_TEXT_FIELD: password,
+            self.REMEMBER_ME_CHECKBOX: True,
+        }, submit=self.LOGIN_BUTTON)
 
     def get_invalid_login_message(self):
         """
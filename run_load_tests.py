@@ -0,0 +1,94 @@
+import argparse
+import importlib
+import os
+import sys
+import yaml
+from utils.api_utility import APIUtility
+from utils.load_test_utility import LoadTestUtility, StubHTTPServer
+
+# Configuration
+CONFIG_FILE = os.path.join("config", "config.yaml")
+DEFAULT_SCENARIO = "apis.load_scenarios:get_root"
+
+def load_config(config_file=CONFIG_FILE):
+    with open(config_file) as f:
+        return yaml.safe_load(f) or {}
+
+def load_scenario(spec):
+    """Import a 'module:function' scenario."""
+    module_name, _, function_name = spec.partition(":")
+    if not function_name:
+        raise argparse.ArgumentTypeError("scenario must look like 'module:function'")
+    return getattr(importlib.import_module(module_name), function_name)
+
+# CLI
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run an APIUtility scenario under load and compare with a baseline")
+    parser.add_argument("--scenario", default=DEFAULT_SCENARIO, help="Scenario as module:function")
+    parser.add_argument("--env", default=None, help="Environment whose URL is targeted (dev, qa, staging, prod)")
+    parser.add_argument("--base-url", default=None, help="Target base URL (overrides --env)")
+    parser.add_argument("--stub", action="store_true", help="Target a local stub HTTP server (hermetic CI)")
+    parser.add_argument("--stub-delay", type=float, default=0.005, help="Stub server response delay in seconds")
+    parser.add_argument("--concurrency", type=int, default=None, help="Concurrent workers")
+    parser.add_argument("--rate", type=float, default=None, help="Target requests per second (default: unlimited)")
+    parser.add_argument("--duration", type=float, default=None, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=None, help="Unmeasured seconds before the run")
+    parser.add_argument("--output", default=None, help="Results JSON (default: <results_dir>/<scenario>.json)")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON (default: <baseline_dir>/<scenario>.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=None, help="Allowed relative regression (e.g. 0.1)")
+    return parser.parse_args()
+
+# Main
+if __name__ == "__main__":
+    args = parse_args()
+    config = load_config()
+    load_config_section = config.get("load_testing", {}) or {}
+    api_connection = config.get("api_connection", {}) or {}
+    APIUtility.configure(
+        pool_size=api_connection.get("pool_size"),
+        retries=api_connection.get("retries"),
+        backoff_factor=api_connection.get("backoff_factor"),
+        timeout=api_connection.get("timeout"),
+    )
+
+    scenario = load_scenario(args.scenario)
+    name = args.scenario.replace(":", ".")
+    concurrency = args.concurrency or load_config_section.get("concurrency", 10)
+    # Keep one pooled connection per worker.
+    APIUtility.configure(pool_size=max(APIUtility.pool_size, concurrency))
+    stub = None
+    if args.stub:
+        stub = StubHTTPServer(routes={path: (200, {"status": "ok"}, args.stub_delay) for path in ("/", "/products")})
+        stub.start()
+        base_url, name = stub.base_url, f"{name}.stub"
+    else:
+        base_url = args.base_url or config.get("urls", {}).get(args.env or config.get("environment", "dev"))
+
+    try:
+        print(f"🚀 Load testing {args.scenario} against {base_url} with {concurrency} worker(s)...")
+        summary = LoadTestUtility(
+            scenario,
+            base_url,
+            concurrency=concurrency,
+            duration=args.duration or load_config_section.get("duration", 10),
+            rate=args.rate,
+            warmup=args.warmup if args.warmup is not None else load_config_section.get("warmup", 1),
+        ).run()
+    finally:
+        if stub:
+            stub.stop()
+        APIUtility.close()
+
+    for line in LoadTestUtility.format_summary(summary):
+        print(f"📈 {line}")
+    regressions = LoadTestUtility.evaluate(
+        summary,
+        results_path=args.output or os.path.join(load_config_section.get("results_dir", "reports/load"), f"{name}.json"),
+        baseline_path=args.baseline or os.path.join(load_config_section.get("baseline_dir", "baselines/load"), f"{name}.json"),
+        tolerance=args.tolerance if args.tolerance is not None else load_config_section.get("tolerance", 0.1),
+        update_baseline=args.update_baseline,
+    )
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    sys.exit(1 if regressions else 0)
@@ -1,9 +1,12 @@
 import subprocess
+import threading
 import time
 import requests
 import sys
 import argparse
+import json
 import os
+import yaml
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 
@@ -14,45 +17,170 @@ GRID_CONTAINER = "selenium-hub"
 SELENIUM_REMOTE_URL = "http://localhost:4444/wd/hub"
 WAIT_TIMEOUT = 240  # seconds
 RETRY_INTERVAL = 2  # seconds
+MAX_PROBE_INTERVAL = 5  # seconds
+SESSION_CHECK_URL = "data:text/html,<title>grid-check</title>"
 MAX_SESSION_RETRIES = 3
 DEFAULT_ALLURE_DIR = "reports/allure"
+SCHEDULE_SUMMARY_FILE = "reports/schedule_summary.json"
+GRID_READY_FILE = "reports/grid_ready.env"
+CONFIG_FILE = os.path.join("config", "config.yaml")
+NODE_SERVICES = {"chrome": "chrome-node", "firefox": "firefox-node"}
 
 # Grid Management
 def start_grid():
     print("🔧 Starting Selenium Grid via Docker Compose...")
     subprocess.run(["docker-compose", "-f", DOCKER_COMPOSE_FILE, "up", "-d"], check=True)
 
-def check_container_health(container_name):
+def container_health(container_name):
+    """Return the container's health status ('healthy', 'starting', 'unhealthy'), or None."""
     try:
         result = subprocess.run(
-            ["docker", "inspect", "--format='{{json .State.Health.Status}}'", container_name],
+            ["docker", "inspect", "--format={{if .State.Health}}{{.State.Health.Status}}{{end}}", container_name],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
-        status = result.stdout.strip().strip("'").replace('"', '')
-        return status == "healthy"
+        return result.stdout.strip() or None
     except Exception as e:
         print(f"⚠️ Health check failed: {e}")
+        return None
+
+def check_container_health(container_name):
+    return container_health(container_name) == "healthy"
+
+def grid_is_ready(status_url=GRID_URL, timeout=5):
+    try:
+        response = requests.get(status_url, timeout=timeout)
+        if response.status_code != 200:
+            return False
+        body = response.json()
+        return bool(body.get("value", {}).get("ready", body.get("ready", False)))
+    except (requests.exceptions.RequestException, ValueError):
         return False
 
-def wait_for_grid():
+def wait_for_grid(status_url=GRID_URL):
+    """Probe the hub with exponential backoff; inspect the container only once HTTP reports ready."""
     print("⏳ Waiting for Selenium Grid to be ready...")
-    for _ in range(WAIT_TIMEOUT):
-        try:
-            response = requests.get(GRID_URL)
-            if response.status_code == 200 and response.json().get("ready", False):
-                if check_container_health(GRID_CONTAINER):
-                    print("✅ Selenium Grid is ready and healthy.")
-                    return
-                else:
-                    print("⚠️ Grid is ready but container health is not OK.")
-        except requests.exceptions.ConnectionError:
-            pass
-        time.sleep(RETRY_INTERVAL)
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    delay = 0.5
+    while time.monotonic() < deadline:
+        if grid_is_ready(status_url):
+            # The compose healthcheck runs every 10s and may still say 'starting'; only 'unhealthy' blocks.
+            if container_health(GRID_CONTAINER) != "unhealthy":
+                print("✅ Selenium Grid is ready and healthy.")
+                return
+            print("⚠️ Grid is ready but container health is not OK.")
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_PROBE_INTERVAL)
     print("❌ Grid did not become ready or healthy in time.")
     sys.exit(1)
 
+def get_service_states():
+    """Map each running compose service to (state, health) with a single docker inspect call."""
+    ids = subprocess.run(
+        ["docker-compose", "-f", DOCKER_COMPOSE_FILE, "ps", "-q"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    ).stdout.split()
+    if not ids:
+        return {}
+    result = subprocess.run(
+        ["docker", "inspect", "--format",
+         '{{index .Config.Labels "com.docker.compose.service"}} {{.State.Status}} '
+         '{{if .State.Health}}{{.State.Health.Status}}{{else}}none{{end}}', *ids],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    states = {}
+    for line in result.stdout.splitlines():
+        service, state, health = line.split()
+        # Scaled services have several replicas; a broken replica marks the whole service.
+        if service not in states or state != "running" or health == "unhealthy":
+            states[service] = (state, health)
+    return states
+
+def ensure_grid():
+    """Reuse a running grid: start missing services and restart only unhealthy ones."""
+    with open(DOCKER_COMPOSE_FILE) as f:
+        expected = set((yaml.safe_load(f) or {}).get("services", {}))
+    states = get_service_states()
+    missing = expected - set(states)
+    if missing:
+        print(f"🔧 Grid services not running: {', '.join(sorted(missing))}")
+        start_grid()
+        return
+    unhealthy = sorted(service for service, (state, health) in states.items()
+                       if state != "running" or health == "unhealthy")
+    if unhealthy:
+        print(f"♻️ Restarting unhealthy grid services: {', '.join(unhealthy)}")
+        subprocess.run(["docker-compose", "-f", DOCKER_COMPOSE_FILE, "restart", *unhealthy], check=True)
+    else:
+        print("♨️ Reusing warm Selenium Grid.")
+
+# Grid Capacity
+def get_grid_capacity(browser, status_url=GRID_URL, timeout=10):
+    """Return (free, total, nodes) session slots and node count for the browser across nodes that are UP."""
+    response = requests.get(status_url, timeout=timeout)
+    response.raise_for_status()
+    free = total = nodes = 0
+    for node in response.json().get("value", {}).get("nodes", []):
+        if node.get("availability", "UP") != "UP":
+            continue
+        slots = node.get("slots", [])
+        busy_on_node = sum(1 for slot in slots if slot.get("session"))
+        browser_slots = [slot for slot in slots if slot.get("stereotype", {}).get("browserName") == browser]
+        if not browser_slots:
+            continue
+        nodes += 1
+        max_sessions = node.get("maxSessions", len(slots))
+        # A node runs at most maxSessions sessions, even if it advertises more slots.
+        total += min(len(browser_slots), max_sessions)
+        free_slots = sum(1 for slot in browser_slots if not slot.get("session"))
+        free += max(min(free_slots, max_sessions - busy_on_node), 0)
+    return free, total, nodes
+
+def sessions_per_worker(config_file=CONFIG_FILE):
+    """Grid sessions one pytest worker holds at once (its own plus pre-warmed spares)."""
+    try:
+        with open(config_file) as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        return 1
+    if config.get("driver_mode", "fresh") != "pool":
+        return 1
+    return 1 + int((config.get("driver_pool") or {}).get("spares", 0) or 0)
+
+def resolve_workers(workers, browser, status_url=GRID_URL, config_file=CONFIG_FILE):
+    """Turn the --workers value into a worker count; 'auto' matches free grid slots."""
+    if workers != "auto":
+        return int(workers)
+    free, total, _ = get_grid_capacity(browser, status_url)
+    per_worker = sessions_per_worker(config_file)
+    count = max(free // per_worker, 1)
+    print(f"🧮 Grid has {free}/{total} free {browser} slot(s), {per_worker} session(s) per worker -> {count} worker(s)")
+    return count
+
+def scale_nodes(browser, concurrency, status_url=GRID_URL):
+    """Scale the browser's node service until the grid offers `concurrency` slots."""
+    service = NODE_SERVICES[browser]
+    _, total, nodes = get_grid_capacity(browser, status_url)
+    if total >= concurrency:
+        return
+    slots_per_node = max(total // nodes, 1) if nodes else 1
+    replicas = -(-concurrency // slots_per_node)
+    print(f"📈 Scaling {service} to {replicas} replica(s) for {concurrency} {browser} slot(s)...")
+    subprocess.run(["docker-compose", "-f", DOCKER_COMPOSE_FILE, "up", "-d", "--no-recreate",
+                    "--scale", f"{service}={replicas}"], check=True)
+    delay = 1
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            if get_grid_capacity(browser, status_url)[1] >= concurrency:
+                return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 10)
+    print(f"⚠️ Grid did not reach {concurrency} {browser} slot(s) in time, continuing with what is available.")
+
 def stop_grid():
     print("🧹 Stopping Selenium Grid...")
     subprocess.run(["docker-compose", "-f", DOCKER_COMPOSE_FILE, "down"], check=True)
@@ -71,7 +199,7 @@ def verify_browser_session(browser, headless):
                 options.add_argument("--headless")
 
             driver = webdriver.Remote(command_executor=SELENIUM_REMOTE_URL, options=options)
-            driver.get("https://www.example.com")
+            driver.get(SESSION_CHECK_URL)
             print(f"✅ Browser session successful on attempt {attempt}")
             driver.quit()
             return True
@@ -81,13 +209,56 @@ def verify_browser_session(browser, headless):
     print("❌ Failed to create browser session after retries.")
     return False
 
+# Grid Boot
+def prepare_grid(args):
+    """Start (or repair) the grid, wait for it, smoke-test a session and scale nodes. Returns True on success."""
+    if args.keep_grid:
+        ensure_grid()
+    else:
+        start_grid()
+    wait_for_grid(args.status_url)
+    if not verify_browser_session(args.browser, args.headless):
+        return False
+    if args.scale:
+        scale_nodes(args.browser, args.scale, args.status_url)
+    return True
+
+def signal_grid_state(status, detail="", path=GRID_READY_FILE):
+    """Write the readiness barrier pytest workers wait on (KEY=value lines, replaced atomically)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(f"GRID_STATUS={status}\nGRID_URL={SELENIUM_REMOTE_URL}\nGRID_DETAIL={detail}\n")
+    os.replace(tmp_path, path)
+
+def boot_grid_in_background(args, path=GRID_READY_FILE):
+    """Boot the grid on a thread and report the outcome through the readiness barrier."""
+    if os.path.exists(path):
+        os.remove(path)
+
+    def boot():
+        try:
+            ok = prepare_grid(args)
+            detail = "" if ok else "browser session check failed"
+        except BaseException as e:  # wait_for_grid gives up via sys.exit()
+            ok, detail = False, f"{type(e).__name__}: {e}"
+        signal_grid_state("ready" if ok else "failed", detail, path)
+        print("✅ Grid ready, browser tests unblocked." if ok else f"❌ Grid boot failed: {detail}")
+
+    thread = threading.Thread(target=boot, name="grid-boot")
+    thread.start()
+    return thread
+
 # Pytest Execution
 def prepare_allure_report_dir(path=DEFAULT_ALLURE_DIR):
     os.makedirs(path, exist_ok=True)
     return path
 
-def build_pytest_command(env, browser, headless, markers, workers, allure_dir):
+def build_pytest_command(env, browser, headless, markers, workers, allure_dir, schedule_by_duration=False):
     cmd = ["pytest", "-n", str(workers), "--grid", f"--alluredir={allure_dir}"]
+    if schedule_by_duration:
+        # The longest-first plan is only honoured when xdist distributes by group.
+        cmd.extend(["--schedule-by-duration", "--dist", "loadgroup"])
     if headless:
         cmd.append("--headless")
     if env:
@@ -98,44 +269,94 @@ def build_pytest_command(env, browser, headless, markers, workers, allure_dir):
         cmd.extend(["-m", markers])
     return cmd
 
-def run_pytest(cmd):
+def run_pytest(cmd, env=None):
     print(f"🚀 Running tests: {' '.join(cmd)}")
-    result = subprocess.run(cmd)
+    result = subprocess.run(cmd, env=env)
     return result.returncode
 
+def clear_schedule_summary(path=SCHEDULE_SUMMARY_FILE):
+    """Remove a summary left by an earlier run so only this run's schedule is reported."""
+    if os.path.exists(path):
+        os.remove(path)
+
+def print_schedule_summary(path=SCHEDULE_SUMMARY_FILE):
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        summary = json.load(f)
+    print(f"⏱️ Makespan over {summary['workers']} workers: predicted {summary['predicted_makespan']:.1f}s, "
+          f"actual {summary['actual_makespan']:.1f}s (wall {summary['wall_time']:.1f}s)")
+
 def launch_allure_report(allure_dir=DEFAULT_ALLURE_DIR):
     print("📊 Generating and launching Allure report...")
     subprocess.run(["allure", "serve", allure_dir])
 
 # CLI
+def workers_arg(value):
+    if value == "auto":
+        return value
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("must be a positive integer or 'auto'")
+    if count < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer or 'auto'")
+    return count
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Run Selenium tests with Dockerized Grid and Allure")
     parser.add_argument("--env", default="qa", help="Environment to test (dev, qa, staging, prod)")
     parser.add_argument("--browser", choices=["chrome", "firefox"], default="chrome", help="Browser to use")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
     parser.add_argument("--markers", help="Run tests with specific pytest markers")
-    parser.add_argument("--workers", type=int, default=4, help="Number of parallel pytest workers")
+    parser.add_argument("--workers", default="4", type=workers_arg,
+                        help="Number of parallel pytest workers, or 'auto' to match free grid slots")
+    parser.add_argument("--scale", type=int, default=None,
+                        help="Scale the browser's grid node service to offer this many slots before running")
+    parser.add_argument("--keep-grid", action="store_true",
+                        help="Reuse an already running grid and leave it running afterwards")
+    parser.add_argument("--stop-grid", action="store_true", help="Stop a kept grid and exit")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Wait for the grid before starting pytest instead of booting both in parallel")
+    parser.add_argument("--schedule-by-duration", action="store_true",
+                        help="Assign tests to workers longest-first from stored durations (uses --dist loadgroup)")
+    parser.add_argument("--status-url", default=GRID_URL, help="Grid /status endpoint used to size workers")
     parser.add_argument("--report", action="store_true", help="Launch Allure report after test run")
     return parser.parse_args()
 
 # Main
 if __name__ == "__main__":
     args = parse_args()
+    if args.stop_grid:
+        stop_grid()
+        sys.exit(0)
     allure_dir = prepare_allure_report_dir()
+    clear_schedule_summary()
+    exit_code = 1
 
     try:
-        start_grid()
-        wait_for_grid()
-        if not verify_browser_session(args.browser, args.headless):
-            print("🛑 Aborting test run due to browser session failure.")
-            stop_grid()
-            sys.exit(1)
-
-        pytest_cmd = build_pytest_command(args.env, args.browser, args.headless, args.markers, args.workers, allure_dir)
-        exit_code = run_pytest(pytest_cmd)
+        if args.sequential or args.workers == "auto":
+            # Sizing workers from free slots needs a running grid.
+            if not prepare_grid(args):
+                print("🛑 Aborting test run due to browser session failure.")
+                sys.exit(1)
+            workers = resolve_workers(args.workers, args.browser, args.status_url)
+            pytest_cmd = build_pytest_command(args.env, args.browser, args.headless, args.markers, workers, allure_dir,
+                                              args.schedule_by_duration)
+            exit_code = run_pytest(pytest_cmd)
+        else:
+            # Pipelined: pytest collects and runs browserless tests while the grid boots;
+            # browser fixtures block on the readiness barrier.
+            grid_boot = boot_grid_in_background(args)
+            pytest_cmd = build_pytest_command(args.env, args.browser, args.headless, args.markers, args.workers,
+                                              allure_dir, args.schedule_by_duration)
+            exit_code = run_pytest(pytest_cmd, env=dict(os.environ, GRID_READY_FILE=GRID_READY_FILE))
+            grid_boot.join()
+        print_schedule_summary()
 
         if exit_code == 0 and args.report:
             launch_allure_report(allure_dir)
     finally:
-        stop_grid()
+        if not args.keep_grid:
+            stop_grid()
     sys.exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,43 @@
+import json
+import pytest
+from utils.api_utility import _iter_array_items
+
+BODY = [1, -2.5, 3e2, "aé\\\"b", {"id": 7, "tags": ["x", "y"]}, [], None, True]
+
+
+@pytest.fixture
+def body_file(tmp_path):
+    def write(text):
+        path = tmp_path / "body.json"
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    return write
+
+
+class TestStreamedArrayItems:
+    """
+    Item-by-item parsing of streamed top-level JSON arrays across chunk boundaries.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_items_across_chunk_sizes(self, body_file, chunk_size):
+        path = body_file(json.dumps(BODY, indent=1))
+        assert list(_iter_array_items(path, chunk_size)) == BODY
+
+    @pytest.mark.parametrize("text", ["[]", " [ ] \n", "[1]\n"])
+    def test_empty_and_padded_arrays(self, body_file, text):
+        assert list(_iter_array_items(body_file(text), 2)) == json.loads(text)
+
+    @pytest.mark.parametrize("text, message", [
+        ('{"a": 1}', "not a top-level array"),
+        ("[1, 2", "Unexpected end"),
+        ("[1, 2,]", "Trailing ','"),
+        ("[1 2]", "Expected ','"),
+        ("[1, tru, 3]", "Malformed item"),
+        ("[1, 2]garbage", "Unexpected data after"),
+        ("[1, 2] ]", "Unexpected data after"),
+    ])
+    @pytest.mark.parametrize("chunk_size", [1, 64])
+    def test_malformed_bodies(self, body_file, text, message, chunk_size):
+        with pytest.raises(ValueError, match=message):
+            list(_iter_array_items(body_file(text), chunk_size))
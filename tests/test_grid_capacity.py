@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+import run_tests
+
+
+def node(browser, slots, busy=0, max_sessions=None, availability="UP"):
+    """Build a Grid 4 /status node entry with `slots` slots for `browser`, `busy` of them in use."""
+    return {
+        "availability": availability,
+        "maxSessions": slots if max_sessions is None else max_sessions,
+        "slots": [
+            {"stereotype": {"browserName": browser}, "session": {"sessionId": f"s{i}"} if i < busy else None}
+            for i in range(slots)
+        ],
+    }
+
+
+class FakeGridStatus:
+    """
+    Minimal Selenium Grid /status endpoint served from a thread; tests set body and delay.
+    """
+
+    def __init__(self):
+        self.body = {"value": {"ready": True, "nodes": []}}
+        self.delay = 0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(fake.delay)
+                payload = json.dumps(fake.body).encode()
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # The client gave up (timeout test).
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.status_url = f"http://127.0.0.1:{self.server.server_address[1]}/status"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def grid_status():
+    fake = FakeGridStatus().start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def grid_config(tmp_path):
+    def write(driver_mode="pool", spares=0):
+        path = tmp_path / "config.yaml"
+        path.write_text(f"driver_mode: {driver_mode}\ndriver_pool:\n  spares: {spares}\n")
+        return str(path)
+    return write
+
+
+class TestGridCapacity:
+    """
+    Grid readiness probing and worker sizing in run_tests.py against a fake /status endpoint.
+    """
+
+    def test_ready_grid(self, grid_status):
+        assert run_tests.grid_is_ready(grid_status.status_url)
+
+    def test_not_ready_grid(self, grid_status):
+        grid_status.body = {"value": {"ready": False, "message": "Selenium Grid not ready.", "nodes": []}}
+        assert not run_tests.grid_is_ready(grid_status.status_url)
+
+    def test_status_timeout(self, grid_status):
+        grid_status.delay = 1
+        assert not run_tests.grid_is_ready(grid_status.status_url, timeout=0.2)
+        with pytest.raises(requests.exceptions.Timeout):
+            run_tests.get_grid_capacity("chrome", grid_status.status_url, timeout=0.2)
+
+    def test_slot_counts(self, grid_status):
+        grid_status.body = {"value": {"ready": True, "nodes": [
+            node("chrome", 4, busy=1),
+            node("chrome", 4, max_sessions=2),
+            node("chrome", 2, availability="DOWN"),
+            node("firefox", 3),
+        ]}}
+        # Node 1: 3 of 4 free; node 2: capped at maxSessions 2; the DOWN and firefox nodes do not count.
+        assert run_tests.get_grid_capacity("chrome", grid_status.status_url) == (5, 6, 2)
+        assert run_tests.get_grid_capacity("firefox", grid_status.status_url) == (3, 3, 1)
+
+    @pytest.mark.parametrize("driver_mode, spares, expected", [
+        ("fresh", 1, 6),
+        ("pool", 0, 6),
+        ("pool", 1, 3),
+        ("pool", 2, 2),
+    ])
+    def test_auto_workers_from_free_slots(self, grid_status, grid_config, driver_mode, spares, expected):
+        grid_status.body = {"value": {"ready": True, "nodes": [node("chrome", 4, busy=1), node("chrome", 3)]}}
+        workers = run_tests.resolve_workers("auto", "chrome", grid_status.status_url, grid_config(driver_mode, spares))
+        assert workers == expected
+
+    def test_auto_workers_on_full_grid(self, grid_status, grid_config):
+        grid_status.body = {"value": {"ready": True, "nodes": [node("chrome", 2, busy=2)]}}
+        assert run_tests.resolve_workers("auto", "chrome", grid_status.status_url, grid_config()) == 1
+
+    def test_explicit_workers_skip_grid(self):
+        assert run_tests.resolve_workers("3", "chrome", status_url="http://127.0.0.1:9/status") == 3
@@ -0,0 +1,127 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from apis.load_scenarios import get_root
+from utils.load_test_utility import LoadTestUtility, StubHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def summary(throughput=100.0, p95=20.0, p99=30.0, error_rate=0.0, concurrency=4, target_rate=None):
+    return {
+        "concurrency": concurrency,
+        "target_rate": target_rate,
+        "throughput": throughput,
+        "error_rate": error_rate,
+        "latency_ms": {"p50": 10.0, "p95": p95, "p99": p99},
+    }
+
+
+class TestLoadStatistics:
+    """
+    Percentiles, summaries and the baseline verdict of LoadTestUtility.
+    """
+
+    def test_percentiles(self):
+        latencies = [i / 1000 for i in range(1, 101)]  # 1..100 ms
+        assert LoadTestUtility._percentiles(latencies) == {
+            "min": 1.0, "mean": 50.5, "p50": 50.5, "p95": 95.05, "p99": 99.01, "max": 100.0,
+        }
+
+    def test_percentiles_of_one_sample(self):
+        assert LoadTestUtility._percentiles([0.25]) == {
+            "min": 250.0, "mean": 250.0, "p50": 250.0, "p95": 250.0, "p99": 250.0, "max": 250.0,
+        }
+        assert LoadTestUtility._percentiles([]) == {}
+
+    def test_summarize_counts_errors(self):
+        load = LoadTestUtility(get_root, "http://stub", concurrency=2)
+        samples = [(0.01, 200, None)] * 6 + [(0.02, 500, None)] * 2 + [(0.03, None, "ConnectionError")] * 2
+        result = load.summarize(samples, elapsed=2.0)
+        assert result["requests"] == 10
+        assert result["throughput"] == 5.0
+        assert result["error_rate"] == 0.4
+        assert result["status_codes"] == {"200": 6, "500": 2}
+        assert result["errors"] == {"ConnectionError": 2}
+
+    def test_compare_within_tolerance(self):
+        assert LoadTestUtility.compare(summary(throughput=95.0, p95=21.0, p99=32.0), summary(), tolerance=0.1) == []
+
+    @pytest.mark.parametrize("current, expected", [
+        (summary(throughput=80.0), "throughput"),
+        (summary(p95=25.0), "p95 latency"),
+        (summary(p99=40.0), "p99 latency"),
+        (summary(error_rate=0.05), "error rate"),
+    ])
+    def test_compare_flags_regression(self, current, expected):
+        regressions = LoadTestUtility.compare(current, summary(), tolerance=0.1)
+        assert len(regressions) == 1 and regressions[0].startswith(expected)
+
+    def test_evaluate_creates_and_updates_baseline(self, tmp_path):
+        results, baseline = str(tmp_path / "results.json"), str(tmp_path / "baseline.json")
+        assert LoadTestUtility.evaluate(summary(), results, baseline) == []
+        assert LoadTestUtility.load_baseline(baseline)["throughput"] == 100.0
+
+        slower = summary(throughput=50.0)
+        assert LoadTestUtility.evaluate(slower, results, baseline) != []
+        assert LoadTestUtility.load_baseline(baseline)["throughput"] == 100.0
+
+        assert LoadTestUtility.evaluate(slower, results, baseline, update_baseline=True) == []
+        assert LoadTestUtility.load_baseline(baseline)["throughput"] == 50.0
+
+    def test_evaluate_skips_baseline_with_other_parameters(self, tmp_path):
+        results, baseline = str(tmp_path / "results.json"), str(tmp_path / "baseline.json")
+        LoadTestUtility.write(summary(concurrency=8), baseline)
+        assert LoadTestUtility.evaluate(summary(throughput=1.0), results, baseline) == []
+
+
+class TestStubLoadRun:
+    """
+    Hermetic load runs against the local stub server.
+    """
+
+    def test_stub_scenario(self):
+        with StubHTTPServer(routes={"/": (200, {"status": "ok"}, 0.01)}) as stub:
+            result = LoadTestUtility(get_root, stub.base_url, concurrency=2, duration=0.5, warmup=0.1).run()
+        latency = result["latency_ms"]
+        assert result["requests"] > 0
+        assert result["error_rate"] == 0.0
+        assert result["status_codes"] == {"200": result["requests"]}
+        assert latency["min"] >= 10.0
+        assert latency["min"] <= latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+    def test_stub_errors(self):
+        with StubHTTPServer(routes={"/": (500, {"error": "internal"}, 0)}) as stub:
+            result = LoadTestUtility(get_root, stub.base_url, concurrency=1, duration=0.2).run()
+        assert result["requests"] > 0
+        assert result["error_rate"] == 1.0
+        assert result["status_codes"] == {"500": result["requests"]}
+
+    def test_cli_stub_run_against_baseline(self, tmp_path):
+        results, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+        command = [sys.executable, "run_load_tests.py", "--stub", "--concurrency", "2", "--duration", "0.5",
+                   "--warmup", "0", "--output", str(results), "--baseline", str(baseline)]
+        first = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, timeout=60)
+        assert first.returncode == 0, first.stdout + first.stderr
+        assert json.loads(baseline.read_text())["requests"] > 0
+
+        recorded = json.loads(baseline.read_text())
+        recorded["throughput"] *= 100
+        baseline.write_text(json.dumps(recorded))
+        second = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, timeout=60)
+        assert second.returncode == 1
+        assert "Regression: throughput" in second.stdout
+
+    @pytest.mark.load(concurrency=2, duration=0.3, warmup=0)
+    def test_load_marker_and_fixture(self, load_test, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)  # results_dir and baseline_dir from config.yaml are relative
+        with StubHTTPServer(routes={"/": (200, {"status": "ok"}, 0)}) as stub:
+            result = load_test(get_root, stub.base_url)
+        assert result["concurrency"] == 2
+        assert result["requests"] > 0 and result["error_rate"] == 0.0
+        written = list((tmp_path / "reports" / "load").glob("*.json"))
+        assert len(written) == 1 and json.loads(written[0].read_text()) == result
+        baselines = list((tmp_path / "baselines" / "load").glob("*.json"))
+        assert len(baselines) == 1 and json.loads(baselines[0].read_text()) == result
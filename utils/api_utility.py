@@ -1,19 +1,330 @@
+import functools
+import hashlib
+import json as jsonlib
+import os
+import re
+import threading
+import uuid
+from urllib.parse import urlsplit
 import requests
-import allure
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.report_utility import ReportUtility
 from utils.logger_utility import logger
 
 try:
-    from jsonschema import validate as jsonschema_validate, ValidationError
+    from jsonschema import ValidationError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:
-    jsonschema_validate = None
+    validator_for = None
     ValidationError = Exception
 
+_UNPARSED = object()
+
+
+# Longest token a chunk boundary can split in a way that is reported before the buffer end (\uXXXX).
+_MAX_ESCAPE_LENGTH = 6
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+
+def _iter_array_items(path, chunk_size):
+    """
+    Yield the items of a top-level JSON array stored in a file, holding at most one item
+    (plus one read chunk) in memory.
+    """
+    decoder = jsonlib.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer, position, eof = "", 0, False
+
+        def fill(size):
+            nonlocal buffer, position, eof
+            chunk = f.read(size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        def skip_whitespace():
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n":
+                    position += 1
+                if position < len(buffer) or eof:
+                    return
+                fill(chunk_size)
+
+        skip_whitespace()
+        if buffer[position:position + 1] != "[":
+            raise ValueError("Streamed JSON body is not a top-level array")
+        position += 1
+        expect_item, first = True, True
+        while True:
+            skip_whitespace()
+            if position >= len(buffer):
+                raise ValueError("Unexpected end of streamed JSON array")
+            char = buffer[position]
+            if char == "]":
+                if expect_item and not first:
+                    raise ValueError("Trailing ',' in streamed JSON array")
+                position += 1
+                skip_whitespace()
+                if position < len(buffer):
+                    raise ValueError(f"Unexpected data after streamed JSON array: {buffer[position:position + 20]!r}")
+                return
+            if char == ",":
+                if expect_item:
+                    raise ValueError(f"Unexpected ',' in streamed JSON array at offset {position}")
+                position += 1
+                expect_item = True
+                continue
+            if not expect_item:
+                raise ValueError(f"Expected ',' or ']' in streamed JSON array, got {char!r}")
+            read_size = chunk_size
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # A value touching the buffer end may continue in the next chunk; so may a number
+                    # followed only by number characters (2 of "2.5" split after the '.').
+                    if eof or not (end == len(buffer) or (isinstance(item, (int, float))
+                                                          and _NUMBER_TAIL.match(buffer, end))):
+                        break
+                except jsonlib.JSONDecodeError as e:
+                    # Only an error at the buffer end can be a value cut by the chunk boundary (strings
+                    # report their start); anything earlier is malformed, so fail instead of reading
+                    # the rest of the body into memory looking for a valid item.
+                    truncated = e.pos >= len(buffer) - _MAX_ESCAPE_LENGTH or e.msg.startswith("Unterminated string")
+                    if eof or not truncated:
+                        raise ValueError(f"Malformed item in streamed JSON array: {e}") from e
+                fill(read_size)
+                read_size *= 2
+            position = end
+            expect_item = first = False
+            yield item
+
+
+def _inline_local_refs(schema):
+    """
+    Return a copy of the schema with local, non-recursive {"$ref": "#/..."} nodes replaced by their
+    targets, so validation does not resolve references per instance. Recursive references,
+    refs with sibling keywords and schemas with nested $id are left to the validator's resolver.
+    """
+    def has_nested_id(node, root=True):
+        if isinstance(node, dict):
+            return (not root and "$id" in node) or any(has_nested_id(v, False) for v in node.values())
+        if isinstance(node, list):
+            return any(has_nested_id(v, False) for v in node)
+        return False
+
+    def resolve(pointer):
+        target = schema
+        for token in pointer.lstrip("#/").split("/") if pointer not in ("#", "#/") else []:
+            token = token.replace("~1", "/").replace("~0", "~")
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        return target
+
+    def inline(node, active):
+        if isinstance(node, list):
+            return [inline(v, active) for v in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if len(node) == 1 and isinstance(ref, str) and ref.startswith("#") and ref not in active:
+            try:
+                return inline(resolve(ref), active | {ref})
+            except (KeyError, IndexError, ValueError, TypeError):
+                return node
+        return {k: inline(v, active) for k, v in node.items()}
+
+    if not isinstance(schema, dict) or has_nested_id(schema):
+        return schema
+    return inline(schema, frozenset())
+
+@functools.lru_cache(maxsize=128)
+def _compile_validator(canonical_schema):
+    """
+    Build and check the validator for a schema given as canonical (key-sorted) JSON.
+    """
+    schema = jsonlib.loads(canonical_schema)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    logger.debug("Compiled %s for schema %s", validator_class.__name__,
+                 hashlib.sha256(canonical_schema.encode()).hexdigest()[:12])
+    return validator_class(_inline_local_refs(schema))
+
 class APIUtility:
     """
     Utility class for generic API interactions with logging and Allure steps.
+    Requests go through one keep-alive requests.Session per base URL (scheme and host),
+    shared by all instances in the process, so connections, cookies and auth are reused.
     """
 
-    @allure.step("Send GET request to '{url}'")
+    pool_size = 10
+    retries = 3
+    backoff_factor = 0.3
+    timeout = 30
+    stream_dir = os.path.join("reports", "downloads")
+    chunk_size = 64 * 1024
+    _sessions = {}
+    _lock = threading.Lock()
+
+    def __init__(self, headers=None, auth=None):
+        """
+        Initialize the API utility.
+        Args:
+            headers (dict, optional): Default headers merged into every request of this instance.
+            auth (tuple or AuthBase, optional): Default auth for requests of this instance.
+        """
+        self.headers = dict(headers or {})
+        self.auth = auth
+
+    @classmethod
+    def configure(cls, pool_size=None, retries=None, backoff_factor=None, timeout=None,
+                  stream_dir=None, chunk_size=None):
+        """
+        Set transport parameters for this process. Applies to sessions created afterwards.
+        Args:
+            pool_size (int, optional): Keep-alive connections kept per base URL.
+            retries (int, optional): Retries for connection errors and 502/503/504 on idempotent methods.
+            backoff_factor (float, optional): Exponential backoff factor between retries.
+            timeout (float, optional): Default request timeout in seconds.
+            stream_dir (str, optional): Directory for bodies downloaded with stream().
+            chunk_size (int, optional): Bytes read per chunk when streaming.
+        """
+        if pool_size is not None:
+            cls.pool_size = pool_size
+        if retries is not None:
+            cls.retries = retries
+        if backoff_factor is not None:
+            cls.backoff_factor = backoff_factor
+        if timeout is not None:
+            cls.timeout = timeout
+        if stream_dir is not None:
+            cls.stream_dir = stream_dir
+        if chunk_size is not None:
+            cls.chunk_size = chunk_size
+
+    @classmethod
+    def session_for(cls, url):
+        """
+        Get (creating on first use) the pooled session for the URL's base.
+        Args:
+            url (str): Request URL.
+        Returns:
+            requests.Session: Session shared by all requests to the same scheme and host.
+        """
+        parts = urlsplit(url)
+        base_url = f"{parts.scheme}://{parts.netloc}"
+        with cls._lock:
+            session = cls._sessions.get(base_url)
+            if session is None:
+                # Retry only methods that are safe to repeat (Retry's default excludes POST and PATCH).
+                retry = Retry(
+                    total=cls.retries,
+                    backoff_factor=cls.backoff_factor,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cls.pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._sessions[base_url] = session
+                logger.debug("Created API session for %s (pool_size=%s)", base_url, cls.pool_size)
+            return session
+
+    @classmethod
+    def stats(cls):
+        """
+        Get connection reuse statistics per base URL for this process.
+        Returns:
+            dict: {base_url: {"requests", "connections", "reuse_ratio"}}.
+        """
+        result = {}
+        with cls._lock:
+            sessions = list(cls._sessions.items())
+        for base_url, session in sessions:
+            requests_sent = connections = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        requests_sent += pool.num_requests
+                        connections += pool.num_connections
+            reuse_ratio = 1 - connections / requests_sent if requests_sent else 0.0
+            result[base_url] = {
+                "requests": requests_sent,
+                "connections": connections,
+                "reuse_ratio": round(reuse_ratio, 3),
+            }
+        return result
+
+    @classmethod
+    def close(cls):
+        """
+        Log reuse statistics and close all pooled sessions.
+        """
+        if not cls._sessions:
+            return
+        logger.info("API connection pool stats: %s", cls.stats())
+        with cls._lock:
+            sessions, cls._sessions = list(cls._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+    @staticmethod
+    def parse_json(response):
+        """
+        Parse a response body once. The result is cached on the response, so every validator
+        called on the same response shares one decode and parse.
+        Args:
+            response (requests.Response): The response object.
+        Returns:
+            Parsed JSON content.
+        """
+        parsed = getattr(response, "_parsed_json", _UNPARSED)
+        if parsed is _UNPARSED:
+            spill_path = getattr(response, "spill_path", None)
+            if spill_path:
+                with open(spill_path, encoding="utf-8") as f:
+                    parsed = jsonlib.load(f)
+            else:
+                parsed = response.json()
+            response._parsed_json = parsed
+        return parsed
+
+    @classmethod
+    def schema_validator(cls, schema):
+        """
+        Get the compiled validator for a schema, building and checking it only on first use.
+        Validators are cached by schema content in a bounded LRU, so equal schemas loaded
+        separately share one validator. Local $refs are inlined once at build time.
+        Args:
+            schema (dict): JSON schema.
+        Returns:
+            jsonschema validator instance.
+        """
+        return _compile_validator(jsonlib.dumps(schema, sort_keys=True))
+
+    def request(self, method, url, headers=None, **kwargs):
+        """
+        Send a request through the pooled session with this instance's defaults.
+        Args:
+            method (str): HTTP method.
+            url (str): The endpoint URL.
+            headers (dict, optional): Request headers, merged over the instance defaults.
+            **kwargs: Additional arguments for requests.Session.request.
+        Returns:
+            Response: requests.Response object.
+        """
+        if self.headers:
+            headers = {**self.headers, **(headers or {})}
+        if self.auth is not None:
+            kwargs.setdefault("auth", self.auth)
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session_for(url).request(method, url, headers=headers, **kwargs)
+
+    @ReportUtility.step("Send GET request to '{url}'")
     def get(self, url, params=None, headers=None, **kwargs):
         """
         Send a GET request.
@@ -21,22 +332,22 @@ class APIUtility:
             url (str): The endpoint URL.
             params (dict, optional): Query parameters.
             headers (dict, optional): Request headers.
-            **kwargs: Additional arguments for requests.get.
+            **kwargs: Additional arguments for requests.Session.request.
         Returns:
             Response: requests.Response object.
         """
         try:
-            logger.info(f"Sending GET request to {url} with params={params} and headers={headers}")
-            response = requests.get(url, params=params, headers=headers, **kwargs)
-            logger.info(f"Received response: {response.status_code}")
-            allure.attach(str(response.text), name="GET Response", attachment_type=allure.attachment_type.TEXT)
+            logger.info("Sending GET request to %s with params=%s and headers=%s", url, params, headers)
+            response = self.request("GET", url, params=params, headers=headers, **kwargs)
+            logger.info("Received response: %s", response.status_code)
+            ReportUtility.attach(lambda: response.text, name="GET Response", failure=response.status_code >= 400)
             return response
         except Exception as e:
-            logger.error(f"GET request to {url} failed: {e}")
-            allure.attach(str(e), name="GET Request Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("GET request to %s failed: %s", url, e)
+            ReportUtility.attach(str(e), name="GET Request Error", failure=True)
             raise
 
-    @allure.step("Send POST request to '{url}'")
+    @ReportUtility.step("Send POST request to '{url}'")
     def post(self, url, data=None, json=None, headers=None, **kwargs):
         """
         Send a POST request.
@@ -45,22 +356,22 @@ class APIUtility:
             data (dict, optional): Form data.
             json (dict, optional): JSON body.
             headers (dict, optional): Request headers.
-            **kwargs: Additional arguments for requests.post.
+            **kwargs: Additional arguments for requests.Session.request.
         Returns:
             Response: requests.Response object.
         """
         try:
-            logger.info(f"Sending POST request to {url} with data={data}, json={json}, headers={headers}")
-            response = requests.post(url, data=data, json=json, headers=headers, **kwargs)
-            logger.info(f"Received response: {response.status_code}")
-            allure.attach(str(response.text), name="POST Response", attachment_type=allure.attachment_type.TEXT)
+            logger.info("Sending POST request to %s with data=%s, json=%s, headers=%s", url, data, json, headers)
+            response = self.request("POST", url, data=data, json=json, headers=headers, **kwargs)
+            logger.info("Received response: %s", response.status_code)
+            ReportUtility.attach(lambda: response.text, name="POST Response", failure=response.status_code >= 400)
             return response
         except Exception as e:
-            logger.error(f"POST request to {url} failed: {e}")
-            allure.attach(str(e), name="POST Request Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("POST request to %s failed: %s", url, e)
+            ReportUtility.attach(str(e), name="POST Request Error", failure=True)
             raise
 
-    @allure.step("Send PUT request to '{url}'")
+    @ReportUtility.step("Send PUT request to '{url}'")
     def put(self, url, data=None, json=None, headers=None, **kwargs):
         """
         Send a PUT request.
@@ -69,44 +380,143 @@ class APIUtility:
             data (dict, optional): Form data.
             json (dict, optional): JSON body.
             headers (dict, optional): Request headers.
-            **kwargs: Additional arguments for requests.put.
+            **kwargs: Additional arguments for requests.Session.request.
         Returns:
             Response: requests.Response object.
         """
         try:
-            logger.info(f"Sending PUT request to {url} with data={data}, json={json}, headers={headers}")
-            response = requests.put(url, data=data, json=json, headers=headers, **kwargs)
-            logger.info(f"Received response: {response.status_code}")
-            allure.attach(str(response.text), name="PUT Response", attachment_type=allure.attachment_type.TEXT)
+            logger.info("Sending PUT request to %s with data=%s, json=%s, headers=%s", url, data, json, headers)
+            response = self.request("PUT", url, data=data, json=json, headers=headers, **kwargs)
+            logger.info("Received response: %s", response.status_code)
+            ReportUtility.attach(lambda: response.text, name="PUT Response", failure=response.status_code >= 400)
             return response
         except Exception as e:
-            logger.error(f"PUT request to {url} failed: {e}")
-            allure.attach(str(e), name="PUT Request Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("PUT request to %s failed: %s", url, e)
+            ReportUtility.attach(str(e), name="PUT Request Error", failure=True)
             raise
 
-    @allure.step("Send DELETE request to '{url}'")
+    @ReportUtility.step("Send DELETE request to '{url}'")
     def delete(self, url, headers=None, **kwargs):
         """
         Send a DELETE request.
         Args:
             url (str): The endpoint URL.
             headers (dict, optional): Request headers.
-            **kwargs: Additional arguments for requests.delete.
+            **kwargs: Additional arguments for requests.Session.request.
         Returns:
             Response: requests.Response object.
         """
         try:
-            logger.info(f"Sending DELETE request to {url} with headers={headers}")
-            response = requests.delete(url, headers=headers, **kwargs)
-            logger.info(f"Received response: {response.status_code}")
-            allure.attach(str(response.text), name="DELETE Response", attachment_type=allure.attachment_type.TEXT)
+            logger.info("Sending DELETE request to %s with headers=%s", url, headers)
+            response = self.request("DELETE", url, headers=headers, **kwargs)
+            logger.info("Received response: %s", response.status_code)
+            ReportUtility.attach(lambda: response.text, name="DELETE Response", failure=response.status_code >= 400)
             return response
         except Exception as e:
-            logger.error(f"DELETE request to {url} failed: {e}")
-            allure.attach(str(e), name="DELETE Request Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("DELETE request to %s failed: %s", url, e)
+            ReportUtility.attach(str(e), name="DELETE Request Error", failure=True)
             raise
 
-    @allure.step("Validate response status code is {expected_status}")
+    @ReportUtility.step("Stream {method} response from '{url}' to a file")
+    def stream(self, method, url, headers=None, **kwargs):
+        """
+        Send a request and download the body to a spill file in chunks, hashing it on the fly.
+        The body is never held in memory; attachments reference the file.
+        Args:
+            method (str): HTTP method.
+            url (str): The endpoint URL.
+            headers (dict, optional): Request headers.
+            **kwargs: Additional arguments for requests.Session.request.
+        Returns:
+            Response: requests.Response with `spill_path`, `size` (bytes) and `sha256` set.
+                Use iter_json_items() or validate_json_items() to check large JSON arrays.
+        """
+        os.makedirs(self.stream_dir, exist_ok=True)
+        spill_path = os.path.join(self.stream_dir, f"{uuid.uuid4().hex}.body")
+        try:
+            logger.info("Streaming %s request to %s into %s", method, url, spill_path)
+            digest, size = hashlib.sha256(), 0
+            with self.request(method, url, headers=headers, stream=True, **kwargs) as response:
+                with open(spill_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        f.write(chunk)
+            response.spill_path, response.size, response.sha256 = spill_path, size, digest.hexdigest()
+            logger.info("Received response: %s, %s bytes, sha256 %s", response.status_code, size, response.sha256)
+            ReportUtility.attach(
+                lambda: self._describe_stream(response),
+                name=f"{method} Streamed Response",
+                failure=response.status_code >= 400,
+            )
+            return response
+        except Exception as e:
+            logger.error("Streamed %s request to %s failed: %s", method, url, e)
+            ReportUtility.attach(str(e), name=f"{method} Streamed Request Error", failure=True)
+            raise
+
+    def iter_json_items(self, response):
+        """
+        Iterate over the items of a streamed top-level JSON array without loading the whole body.
+        Args:
+            response (requests.Response): Response returned by stream().
+        Returns:
+            iterator: Parsed items in order.
+        """
+        return _iter_array_items(response.spill_path, self.chunk_size)
+
+    @ReportUtility.step("Validate streamed JSON array items")
+    def validate_json_items(self, response, item_schema=None, check=None, max_errors=10):
+        """
+        Validate a streamed top-level JSON array item by item.
+        Args:
+            response (requests.Response): Response returned by stream().
+            item_schema (dict, optional): JSON schema every item must satisfy.
+            check (callable, optional): Called with each item; falsy return or AssertionError marks it invalid.
+            max_errors (int): Stop after this many invalid items.
+        Returns:
+            bool: True if every item is valid, else False.
+        """
+        if item_schema is not None and not validator_for:
+            logger.error("jsonschema package is not installed.")
+            ReportUtility.attach("jsonschema package is not installed.", name="Schema Validation Error", failure=True)
+            return False
+        validator = self.schema_validator(item_schema) if item_schema is not None else None
+        errors, count = [], 0
+        try:
+            for index, item in enumerate(self.iter_json_items(response)):
+                count += 1
+                error = best_match(validator.iter_errors(item)) if validator else None
+                if error is not None:
+                    errors.append(f"item {index}: {error.message}")
+                elif check is not None:
+                    try:
+                        result = check(item)
+                        if not result:
+                            errors.append(f"item {index}: check returned {result!r}")
+                    except AssertionError as e:
+                        errors.append(f"item {index}: {e}")
+                if len(errors) >= max_errors:
+                    break
+        except ValueError as e:
+            errors.append(f"invalid JSON after {count} items: {e}")
+        if errors:
+            message = "\n".join(errors)
+            logger.error("Streamed JSON validation failed:\n%s", message)
+            ReportUtility.attach(
+                f"{message}\nBody: {response.spill_path}", name="Streamed JSON Validation Error", failure=True
+            )
+            return False
+        logger.info("Validated %s streamed JSON items.", count)
+        return True
+
+    def _describe_stream(self, response):
+        with open(response.spill_path, encoding="utf-8", errors="replace") as f:
+            head = f.read(min(ReportUtility.max_attachment_size, 4096))
+        return (f"Status: {response.status_code}\nBody: {response.spill_path}\n"
+                f"Size: {response.size} bytes\nSHA-256: {response.sha256}\n\n{head}")
+
+    @ReportUtility.step("Validate response status code is {expected_status}")
     def validate_status_code(self, response, expected_status):
         """
         Validate the response status code.
@@ -117,16 +527,16 @@ class APIUtility:
             bool: True if status matches, else False.
         """
         actual_status = response.status_code
-        logger.info(f"Validating status code: expected={expected_status}, actual={actual_status}")
+        logger.info("Validating status code: expected=%s, actual=%s", expected_status, actual_status)
         try:
             assert actual_status == expected_status, f"Expected {expected_status}, got {actual_status}"
             return True
         except AssertionError as e:
             logger.error(str(e))
-            allure.attach(str(e), name="Status Code Validation Error", attachment_type=allure.attachment_type.TEXT)
+            ReportUtility.attach(str(e), name="Status Code Validation Error", failure=True)
             return False
 
-    @allure.step("Get JSON from response")
+    @ReportUtility.step("Get JSON from response")
     def get_json(self, response):
         """
         Get JSON content from a response.
@@ -136,15 +546,17 @@ class APIUtility:
             dict: Parsed JSON content.
         """
         try:
-            json_data = response.json()
-            logger.info(f"JSON response: {json_data}")
+            json_data = self.parse_json(response)
+            size = getattr(response, "size", None)
+            logger.info("Parsed JSON response (%s bytes)", size if size is not None else len(response.content))
+            logger.debug("JSON response: %s", json_data)
             return json_data
         except Exception as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            allure.attach(str(e), name="JSON Parse Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to parse JSON: %s", e)
+            ReportUtility.attach(str(e), name="JSON Parse Error", failure=True)
             raise
 
-    @allure.step("Validate response body contains expected key-value pairs")
+    @ReportUtility.step("Validate response body contains expected key-value pairs")
     def validate_response_body(self, response, expected_body):
         """
         Validate that the response body contains the expected key-value pairs.
@@ -155,18 +567,18 @@ class APIUtility:
             bool: True if all key-value pairs are present and match, else False.
         """
         try:
-            json_data = response.json()
+            json_data = self.parse_json(response)
             for key, value in expected_body.items():
                 assert key in json_data, f"Key '{key}' not found in response body"
                 assert json_data[key] == value, f"Value for key '{key}' does not match. Expected: {value}, Actual: {json_data[key]}"
             logger.info("Response body validation passed.")
             return True
         except Exception as e:
-            logger.error(f"Response body validation failed: {e}")
-            allure.attach(str(e), name="Response Body Validation Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Response body validation failed: %s", e)
+            ReportUtility.attach(str(e), name="Response Body Validation Error", failure=True)
             return False
 
-    @allure.step("Validate response body contains expected key-value pairs (contains operation)")
+    @ReportUtility.step("Validate response body contains expected key-value pairs (contains operation)")
     def validate_response_body_contains(self, response, expected_body):
         """
         Validate that the response body contains the expected key-value pairs (using 'in' for values).
@@ -177,7 +589,7 @@ class APIUtility:
             bool: True if all key-value pairs or substrings are present, else False.
         """
         try:
-            json_data = response.json()
+            json_data = self.parse_json(response)
             for key, value in expected_body.items():
                 assert key in json_data, f"Key '{key}' not found in response body"
                 assert value in str(json_data[key]), (
@@ -187,11 +599,11 @@ class APIUtility:
             logger.info("Response body 'contains' validation passed.")
             return True
         except Exception as e:
-            logger.error(f"Response body 'contains' validation failed: {e}")
-            allure.attach(str(e), name="Response Body Contains Validation Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Response body 'contains' validation failed: %s", e)
+            ReportUtility.attach(str(e), name="Response Body Contains Validation Error", failure=True)
             return False
 
-    @allure.step("Validate response JSON schema")
+    @ReportUtility.step("Validate response JSON schema")
     def validate_json_schema(self, response, schema):
         """
         Validate the response JSON against a provided schema.
@@ -201,20 +613,22 @@ class APIUtility:
         Returns:
             bool: True if schema is valid, else False.
         """
-        if not jsonschema_validate:
+        if not validator_for:
             logger.error("jsonschema package is not installed.")
-            allure.attach("jsonschema package is not installed.", name="Schema Validation Error", attachment_type=allure.attachment_type.TEXT)
+            ReportUtility.attach("jsonschema package is not installed.", name="Schema Validation Error", failure=True)
             return False
         try:
-            json_data = response.json()
-            jsonschema_validate(instance=json_data, schema=schema)
+            json_data = self.parse_json(response)
+            error = best_match(self.schema_validator(schema).iter_errors(json_data))
+            if error is not None:
+                raise error
             logger.info("JSON schema validation passed.")
             return True
         except ValidationError as e:
-            logger.error(f"JSON schema validation failed: {e}")
-            allure.attach(str(e), name="Schema Validation Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("JSON schema validation failed: %s", e)
+            ReportUtility.attach(str(e), name="Schema Validation Error", failure=True)
             return False
         except Exception as e:
-            logger.error(f"Schema validation error: {e}")
-            allure.attach(str(e), name="Schema Validation Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Schema validation error: %s", e)
+            ReportUtility.attach(str(e), name="Schema Validation Error", failure=True)
             return False
\ No newline at end of file
@@ -0,0 +1,203 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.api_utility import APIUtility
+from utils.report_utility import ReportUtility
+from utils.logger_utility import logger
+
+
+class AsyncAPIUtility:
+    """
+    Concurrent fan-out of APIUtility requests behind an awaitable interface.
+    This is not a native asyncio HTTP client: every request is a blocking requests call run on
+    a bounded ThreadPoolExecutor, and the coroutines only await those threads. Going through
+    APIUtility's pooled sessions, requests share keep-alive connections, retries and default
+    headers with the synchronous helpers. Results always come back in request order. Allure
+    attachments are made on the caller's thread after the batch completes.
+    """
+
+    def __init__(self, api_utility=None, concurrency=None, timeout=None):
+        """
+        Initialize the async client.
+        Args:
+            api_utility (APIUtility, optional): Sync utility providing sessions, defaults and validators.
+            concurrency (int, optional): Maximum requests in flight; defaults to APIUtility.pool_size
+                so every request gets a pooled connection.
+            timeout (float, optional): Default requests timeout in seconds. Like requests' own timeout it
+                bounds connecting and each socket read, not the total duration of a request or batch.
+        """
+        self.api_utility = api_utility or APIUtility()
+        self.concurrency = concurrency or APIUtility.pool_size
+        self.timeout = timeout
+        self._executor = None
+        self._semaphore = None
+        self._loop = None
+
+    async def request(self, method, url, timeout=None, **kwargs):
+        """
+        Send one request without blocking the event loop.
+        Args:
+            method (str): HTTP method.
+            url (str): The endpoint URL.
+            timeout (float, optional): requests timeout (connect and per-read, not a total deadline);
+                overrides the client default.
+            **kwargs: Additional arguments for APIUtility.request.
+        Returns:
+            Response: requests.Response object.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        loop = asyncio.get_running_loop()
+        async with self._limit(loop):
+            started = time.perf_counter()
+            response = await loop.run_in_executor(
+                self._executor, lambda: self.api_utility.request(method, url, **kwargs)
+            )
+        logger.debug("%s %s -> %s in %.3fs", method, url, response.status_code, time.perf_counter() - started)
+        return response
+
+    async def get(self, url, params=None, headers=None, **kwargs):
+        return await self.request("GET", url, params=params, headers=headers, **kwargs)
+
+    async def post(self, url, data=None, json=None, headers=None, **kwargs):
+        return await self.request("POST", url, data=data, json=json, headers=headers, **kwargs)
+
+    async def put(self, url, data=None, json=None, headers=None, **kwargs):
+        return await self.request("PUT", url, data=data, json=json, headers=headers, **kwargs)
+
+    async def delete(self, url, headers=None, **kwargs):
+        return await self.request("DELETE", url, headers=headers, **kwargs)
+
+    async def gather(self, requests, return_exceptions=True):
+        """
+        Send a batch of requests concurrently, at most `concurrency` at a time.
+        Args:
+            requests (list): Items of (method, url) or (method, url, kwargs), or dicts with
+                'method', 'url' and request kwargs.
+            return_exceptions (bool): Return failures in place of responses instead of raising the first.
+        Returns:
+            list: Responses (or exceptions) in the same order as `requests`.
+        """
+        calls = [self._normalize(spec) for spec in requests]
+        logger.info("Sending %s requests with concurrency %s", len(calls), self.concurrency)
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(
+                *(self.request(method, url, **kwargs) for method, url, kwargs in calls),
+                return_exceptions=return_exceptions,
+            )
+        except Exception as e:
+            logger.error("Request batch failed: %s", e)
+            ReportUtility.attach(str(e), name="Batch Request Error", failure=True)
+            raise
+        logger.info("Completed %s requests in %.3fs", len(calls), time.perf_counter() - started)
+        self._attach_failures(calls, results)
+        return results
+
+    async def map(self, method, urls, return_exceptions=True, **kwargs):
+        """
+        Send the same kind of request to many URLs.
+        Args:
+            method (str): HTTP method.
+            urls (list): Endpoint URLs.
+            return_exceptions (bool): Return failures in place of responses instead of raising the first.
+            **kwargs: Request arguments shared by every call.
+        Returns:
+            list: Responses (or exceptions) in the same order as `urls`.
+        """
+        return await self.gather([(method, url, kwargs) for url in urls], return_exceptions=return_exceptions)
+
+    def gather_sync(self, requests, return_exceptions=True):
+        """
+        Blocking wrapper around gather() for ordinary (non-async) tests.
+        """
+        return self.run(self.gather(requests, return_exceptions=return_exceptions))
+
+    def map_sync(self, method, urls, return_exceptions=True, **kwargs):
+        """
+        Blocking wrapper around map() for ordinary (non-async) tests.
+        """
+        return self.run(self.map(method, urls, return_exceptions=return_exceptions, **kwargs))
+
+    def run(self, coroutine):
+        """
+        Run a coroutine to completion from synchronous code.
+        Raises:
+            RuntimeError: If called while an event loop is already running in this thread; await instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError("AsyncAPIUtility.run() cannot be used inside a running event loop; await the coroutine.")
+
+    def close(self):
+        """
+        Shut down the request thread pool. Pooled sessions stay open for other users.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def validate_status_code(self, response, expected_status):
+        return self.api_utility.validate_status_code(response, expected_status)
+
+    def validate_response_body(self, response, expected_body):
+        return self.api_utility.validate_response_body(response, expected_body)
+
+    def validate_response_body_contains(self, response, expected_body):
+        return self.api_utility.validate_response_body_contains(response, expected_body)
+
+    def validate_json_schema(self, response, schema):
+        return self.api_utility.validate_json_schema(response, schema)
+
+    def validate_all_status_codes(self, responses, expected_status):
+        """
+        Validate the status code of every response in a batch.
+        Args:
+            responses (list): Results of gather() or map(); exceptions count as failures.
+            expected_status (int): Expected HTTP status code.
+        Returns:
+            bool: True if every response has the expected status, else False.
+        """
+        failures = [
+            f"#{index}: {result!r}" if isinstance(result, BaseException) else f"#{index}: {result.status_code}"
+            for index, result in enumerate(responses)
+            if isinstance(result, BaseException) or result.status_code != expected_status
+        ]
+        if failures:
+            message = f"Expected {expected_status} for all {len(responses)} responses, got: {', '.join(failures)}"
+            logger.error(message)
+            ReportUtility.attach(message, name="Batch Status Code Validation Error", failure=True)
+            return False
+        logger.info("All %s responses returned %s.", len(responses), expected_status)
+        return True
+
+    def _limit(self, loop):
+        # The semaphore belongs to one event loop; asyncio.run() creates a new loop per call.
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="async-api")
+        return self._semaphore
+
+    @staticmethod
+    def _normalize(spec):
+        if isinstance(spec, dict):
+            kwargs = dict(spec)
+            return kwargs.pop("method", "GET").upper(), kwargs.pop("url"), kwargs
+        method, url, *rest = spec
+        return method.upper(), url, dict(rest[0]) if rest else {}
+
+    @staticmethod
+    def _attach_failures(calls, results):
+        failures = [
+            f"{method} {url}: {result!r}" if isinstance(result, BaseException) else f"{method} {url}: {result.status_code}"
+            for (method, url, _), result in zip(calls, results)
+            if isinstance(result, BaseException) or result.status_code >= 400
+        ]
+        if failures:
+            ReportUtility.attach("\n".join(failures), name="Batch Request Failures", failure=True)
@@ -0,0 +1,109 @@
+import time
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+from utils.logger_utility import logger
+
+
+class BrowserContextUtility:
+    """
+    Keeps one Chrome process per worker and hands each test an isolated browser context
+    (separate cookies, storage and cache) created through the DevTools protocol.
+    The same WebDriver object is returned, switched to the context's window, so page
+    objects work against it unchanged.
+    """
+
+    def __init__(self, factory, base_url=None):
+        """
+        Initialize the context manager.
+        Args:
+            factory (callable): Zero-argument callable returning a local Chrome WebDriver.
+            base_url (str, optional): URL each new context is opened on.
+        """
+        self.factory = factory
+        self.base_url = base_url
+        self.driver = None
+        self._root_handle = None
+        self.context_id = None
+
+    def open_context(self):
+        """
+        Create a fresh isolated context with one window and switch the driver to it.
+        Its id is kept in context_id until the context is closed.
+        Returns:
+            WebDriver: The shared driver, focused on the new context's window.
+        """
+        try:
+            return self._open_context()
+        except WebDriverException as e:
+            logger.warning("Browser is not usable, relaunching it: %s", e)
+            self._quit_browser()
+            return self._open_context()
+
+    def close_context(self, driver, context_id=None):
+        """
+        Dispose a context, closing all of its windows (popups included). The context is
+        identified by id, not by the focused window, which the test may have switched or closed.
+        Args:
+            driver (WebDriver): Driver returned by open_context().
+            context_id (str, optional): Context to dispose; defaults to the last opened one.
+        """
+        context_id = context_id or self.context_id
+        if context_id == self.context_id:
+            self.context_id = None
+        try:
+            if context_id:
+                driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            driver.switch_to.window(self._root_handle)
+        except WebDriverException as e:
+            logger.warning("Failed to dispose browser context, relaunching browser: %s", e)
+            self._quit_browser()
+
+    def close(self):
+        """
+        Quit the shared browser. Called once at the end of the worker's session.
+        """
+        self._quit_browser()
+
+    def _open_context(self):
+        if self.driver is None:
+            self.driver = self.factory()
+            self._root_handle = self.driver.current_window_handle
+            logger.info("Launched shared browser %s for isolated contexts", self.driver.session_id)
+        driver = self.driver
+        context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        target_id = driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+        )["targetId"]
+        self.context_id = context_id
+        self._switch_to_target(driver, target_id)
+        try:
+            driver.maximize_window()
+        except WebDriverException:
+            pass
+        if self.base_url:
+            driver.get(self.base_url)
+        logger.debug("Opened browser context %s", context_id)
+        return driver
+
+    @staticmethod
+    def _switch_to_target(driver, target_id, timeout=5):
+        # ChromeDriver uses DevTools target ids as window handles; a new target can take a
+        # moment to show up in the handle list.
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                driver.switch_to.window(target_id)
+                return
+            except NoSuchWindowException:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def _quit_browser(self):
+        driver, self.driver = self.driver, None
+        self.context_id = None
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting shared browser: %s", e)
@@ -0,0 +1,207 @@
+import threading
+import time
+from utils.logger_utility import logger
+
+# Cheapest round trip per backend, used as the checkout health check.
+PING_QUERIES = {"postgres": "SELECT 1", "db2": "SELECT 1 FROM SYSIBM.SYSDUMMY1"}
+
+
+class DatabasePoolUtility:
+    """
+    Per-process pool of database connections. Connections are health-checked on checkout,
+    replaced after max_lifetime seconds and reset (rolled back, session state discarded) when
+    returned, so a test never sees another test's transaction or session settings.
+    """
+
+    def __init__(self, factory, db_type="postgres", min_size=1, max_size=5, max_lifetime=1800,
+                 health_check=True, checkout_timeout=30):
+        """
+        Initialize the pool. Connections are opened on first use.
+        Args:
+            factory (callable): Zero-argument callable returning a new DB-API connection.
+            db_type (str): 'postgres' or 'db2'.
+            min_size (int): Connections opened on first checkout and kept idle.
+            max_size (int): Maximum open connections (idle plus checked out).
+            max_lifetime (float): Seconds after which a connection is closed instead of reused (0 = unlimited).
+            health_check (bool): Ping connections on checkout and replace broken ones.
+            checkout_timeout (float): Seconds acquire() waits for a free connection.
+        """
+        self.factory = factory
+        self.db_type = db_type
+        self.min_size = max(int(min_size), 0)
+        self.max_size = max(int(max_size), 1)
+        self.max_lifetime = max_lifetime
+        self.health_check = health_check
+        self.checkout_timeout = checkout_timeout
+        self._idle = []
+        self._created_at = {}
+        self._size = 0
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {"created": 0, "checkouts": 0, "reused": 0, "recycled": 0, "unhealthy": 0}
+
+    def acquire(self):
+        """
+        Check out a healthy connection, opening one if none is idle and the pool is not full.
+        Returns:
+            connection: DB-API connection.
+        Raises:
+            TimeoutError: If every connection stays checked out for checkout_timeout seconds.
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        self._fill()
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Database pool is closed.")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No database connection became free within {self.checkout_timeout}s")
+                    self._condition.wait(remaining)
+                connection = self._idle.pop() if self._idle else None
+                if connection is None:
+                    # Reserve the slot, then connect outside the lock.
+                    self._size += 1
+            if connection is None:
+                connection = self._open()
+            elif not self._usable(connection):
+                continue
+            else:
+                self._stats["reused"] += 1
+            with self._condition:
+                self._in_use += 1
+                self._stats["checkouts"] += 1
+            return connection
+
+    def release(self, connection, broken=False):
+        """
+        Return a connection. Its transaction is rolled back and session state reset; connections
+        that fail the reset, are broken or have outlived max_lifetime are closed instead.
+        Args:
+            connection: Connection obtained from acquire().
+            broken (bool): Close the connection instead of returning it.
+        """
+        with self._condition:
+            self._in_use -= 1
+        if not broken and not self._closed and not self._expired(connection):
+            try:
+                self._reset(connection)
+            except Exception as e:
+                logger.warning("Discarding database connection that failed to reset: %s", e)
+                broken = True
+            else:
+                with self._condition:
+                    self._idle.append(connection)
+                    self._condition.notify()
+                return
+        self._discard(connection)
+
+    def stats(self):
+        """
+        Get pool statistics for this process.
+        Returns:
+            dict: created, checkouts, reused, recycled, unhealthy, idle and in_use counts.
+        """
+        with self._condition:
+            return dict(self._stats, idle=len(self._idle), in_use=self._in_use)
+
+    def close(self):
+        """
+        Close all idle connections and refuse further checkouts. Checked-out connections are
+        closed when released.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for connection in idle:
+            self._discard(connection)
+        logger.info("Database pool stats: %s", self.stats())
+
+    def _fill(self):
+        # Open min_size connections on first use so later checkouts find them idle.
+        with self._condition:
+            missing = self.min_size - self._size
+            if missing <= 0:
+                return
+            self._size += missing
+        opened = []
+        try:
+            for _ in range(missing):
+                opened.append(self._open())
+        except Exception:
+            with self._condition:
+                # _open() gave back the failed attempt's slot; give back the unattempted ones too.
+                self._size -= missing - len(opened) - 1
+            raise
+        finally:
+            with self._condition:
+                self._idle.extend(opened)
+                self._condition.notify_all()
+
+    def _open(self):
+        # The caller has already reserved a slot in _size; give it back if connecting fails.
+        try:
+            connection = self.factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created_at[id(connection)] = time.monotonic()
+            self._stats["created"] += 1
+        logger.debug("Opened pooled %s connection", self.db_type)
+        return connection
+
+    def _usable(self, connection):
+        if self._expired(connection):
+            self._stats["recycled"] += 1
+            self._discard(connection)
+            return False
+        if not self.health_check:
+            return True
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(PING_QUERIES.get(self.db_type, "SELECT 1"))
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            connection.rollback()
+            return True
+        except Exception as e:
+            logger.warning("Pooled database connection failed health check, replacing it: %s", e)
+            self._stats["unhealthy"] += 1
+            self._discard(connection)
+            return False
+
+    def _expired(self, connection):
+        created = self._created_at.get(id(connection))
+        return bool(self.max_lifetime) and created is not None and time.monotonic() - created > self.max_lifetime
+
+    def _reset(self, connection):
+        connection.rollback()
+        if self.db_type == "postgres":
+            # DISCARD ALL drops temp tables, prepared statements and SET values; it cannot run in a transaction.
+            autocommit = connection.autocommit
+            connection.autocommit = True
+            try:
+                cursor = connection.cursor()
+                cursor.execute("DISCARD ALL")
+                cursor.close()
+            finally:
+                connection.autocommit = autocommit
+
+    def _discard(self, connection):
+        with self._condition:
+            self._created_at.pop(id(connection), None)
+            self._size -= 1
+            self._condition.notify()
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug("Error closing pooled database connection: %s", e)
+
@@ -1,4 +1,14 @@
+import contextlib
+import csv
+import io
+import itertools
+import json
 import os
+import re
+import threading
+import time
+import uuid
+from utils.database_pool_utility import DatabasePoolUtility
 from utils.logger_utility import logger
 
 try:
@@ -15,58 +25,264 @@ except ImportError:
     ibm_db = None
     ibm_db_dbi = None
 
+_EXPLAINABLE = re.compile(r"^\s*(select|with|insert|update|delete)\b", re.IGNORECASE)
+SAVEPOINT_STATEMENTS = {"postgres": "SAVEPOINT {}", "db2": "SAVEPOINT {} ON ROLLBACK RETAIN CURSORS"}
+
+
+class _CsvStream(io.TextIOBase):
+    """
+    Read-only text stream rendering rows as CSV on demand, for COPY ... FROM STDIN.
+    None is written as \\N so it loads as NULL.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = ""
+        self._out = io.StringIO()
+        self._writer = csv.writer(self._out, lineterminator="\n")
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(["\\N" if value is None else value for value in row])
+            self._buffer += self._out.getvalue()
+            self._out.seek(0)
+            self._out.truncate()
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    readline = read
+
+
 class DatabaseUtility:
     """
     Utility class for database interactions (PostgreSQL and IBM DB2) with logging.
+    With pooling enabled (see configure_pool), connect() checks a connection out of a
+    per-process pool shared by all instances and disconnect() returns it.
     """
 
-    def __init__(self, connection_string, db_type="postgres"):
+    batch_size = 1000
+    bulk_chunk_size = 10000
+    log_sample_rows = 3
+    profiler = None
+    pooling = False
+    pool_settings = {}
+    _pools = {}
+    _pools_lock = threading.Lock()
+    _scopes = {}
+
+    def __init__(self, connection_string, db_type="postgres", pool=None):
         """
         Initialize DatabaseUtility with a connection string and database type.
         Args:
             connection_string (str): Database connection string.
             db_type (str): Type of database ('postgres' or 'db2').
+            pool (DatabasePoolUtility, optional): Pool to check connections out of; defaults to
+                the shared pool for this connection string when pooling is enabled.
         """
         self.connection_string = connection_string
         self.db_type = db_type.lower()
+        self.pool = pool
         self.connection = None
         self.cursor = None
+        self.scoped = False
+
+    @classmethod
+    def configure(cls, batch_size=None, log_sample_rows=None, bulk_chunk_size=None):
+        """
+        Set result fetching and bulk loading parameters for this process.
+        Args:
+            batch_size (int, optional): Rows fetched per round trip by iter_query().
+            log_sample_rows (int, optional): Rows written to the debug log when results are fetched.
+            bulk_chunk_size (int, optional): Rows loaded per commit by bulk_insert().
+        """
+        if batch_size is not None:
+            cls.batch_size = batch_size
+        if bulk_chunk_size is not None:
+            cls.bulk_chunk_size = bulk_chunk_size
+        if log_sample_rows is not None:
+            cls.log_sample_rows = log_sample_rows
+
+    @classmethod
+    def configure_pool(cls, enabled=True, **settings):
+        """
+        Enable connection pooling for this process.
+        Args:
+            enabled (bool): Use pooled connections in connect()/disconnect().
+            **settings: DatabasePoolUtility options (min_size, max_size, max_lifetime, health_check,
+                checkout_timeout) for pools created afterwards.
+        """
+        cls.pooling = enabled
+        cls.pool_settings = {key: value for key, value in settings.items() if value is not None}
+
+    @classmethod
+    def pool_for(cls, connection_string, db_type="postgres"):
+        """
+        Get (creating on first use) the process-wide pool for a connection string.
+        Returns:
+            DatabasePoolUtility: Shared pool.
+        """
+        db_type = db_type.lower()
+        with cls._pools_lock:
+            pool = cls._pools.get((connection_string, db_type))
+            if pool is None:
+                pool = DatabasePoolUtility(
+                    factory=lambda: cls.open_connection(connection_string, db_type),
+                    db_type=db_type,
+                    **cls.pool_settings,
+                )
+                cls._pools[(connection_string, db_type)] = pool
+            return pool
+
+    @classmethod
+    def close_pools(cls):
+        """
+        Close every shared pool of this process.
+        """
+        with cls._pools_lock:
+            pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    @classmethod
+    @contextlib.contextmanager
+    def transaction_scope(cls, connection_string, db_type="postgres", lazy=False):
+        """
+        Pin one connection for the duration of the block and roll everything back at the end.
+        Inside the scope every DatabaseUtility for the same connection string uses the pinned
+        connection and never commits. A nested scope uses a savepoint instead of a transaction.
+        Args:
+            connection_string (str): Database connection string.
+            db_type (str): 'postgres' or 'db2'.
+            lazy (bool): Check the connection out on first use (a DatabaseUtility connecting or a
+                nested scope) instead of on entry; a scope that is never used costs nothing.
+        Returns:
+            connection: The pinned connection, or None for a lazy outermost scope.
+        """
+        key = (connection_string, db_type.lower())
+        scope = cls._scopes.get(key)
+        if scope is not None:
+            connection, name = cls._scope_connection(key), f"test_scope_{scope['depth']}"
+            cls._run(connection, SAVEPOINT_STATEMENTS[key[1]].format(name))
+            scope["depth"] += 1
+            try:
+                yield connection
+            finally:
+                scope["depth"] -= 1
+                cls._run(connection, f"ROLLBACK TO SAVEPOINT {name}")
+                cls._run(connection, f"RELEASE SAVEPOINT {name}")
+            return
+        scope = {"connection": None, "pool": cls.pool_for(*key) if cls.pooling else None, "depth": 1}
+        cls._scopes[key] = scope
+        try:
+            yield None if lazy else cls._scope_connection(key)
+        finally:
+            del cls._scopes[key]
+            connection, pool = scope["connection"], scope["pool"]
+            if connection is not None:
+                broken = False
+                try:
+                    connection.rollback()
+                    logger.debug("Rolled back transactional test scope.")
+                except Exception as e:
+                    logger.error("Rollback of transactional test scope failed: %s", e)
+                    broken = True
+                if pool:
+                    pool.release(connection, broken=broken)
+                else:
+                    connection.close()
+
+    @classmethod
+    def _scope_connection(cls, key):
+        # The scope's pinned connection, checked out on first use.
+        scope = cls._scopes[key]
+        if scope["connection"] is None:
+            pool = scope["pool"]
+            scope["connection"] = pool.acquire() if pool else cls.open_connection(*key)
+            logger.debug("Opened transactional test scope on a %s connection.", key[1])
+        return scope["connection"]
+
+    @staticmethod
+    def _run(connection, statement):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def open_connection(connection_string, db_type):
+        """
+        Open a new, unpooled connection.
+        Args:
+            connection_string (str): Database connection string.
+            db_type (str): 'postgres' or 'db2'.
+        Returns:
+            connection: DB-API connection.
+        """
+        if db_type == "postgres":
+            if not psycopg2:
+                raise ImportError("psycopg2 is not installed.")
+            return psycopg2.connect(connection_string)
+        if db_type == "db2":
+            if not ibm_db or not ibm_db_dbi:
+                raise ImportError("ibm_db and ibm_db_dbi are not installed.")
+            return ibm_db_dbi.connect(connection_string, "", "")
+        raise ValueError("Unsupported database type. Use 'postgres' or 'db2'.")
 
     def connect(self):
         """
-        Establish a connection to the database.
+        Establish a connection to the database, or check one out of the pool.
         """
         try:
-            logger.info(f"Connecting to the {self.db_type} database.")
-            if self.db_type == "postgres":
-                if not psycopg2:
-                    raise ImportError("psycopg2 is not installed.")
-                self.connection = psycopg2.connect(self.connection_string)
-                self.cursor = self.connection.cursor()
-            elif self.db_type == "db2":
-                if not ibm_db or not ibm_db_dbi:
-                    raise ImportError("ibm_db and ibm_db_dbi are not installed.")
-                self.connection = ibm_db_dbi.connect(self.connection_string, "", "")
-                self.cursor = self.connection.cursor()
+            key = (self.connection_string, self.db_type)
+            if self.pool is None and self.pooling:
+                self.pool = self.pool_for(self.connection_string, self.db_type)
+            if key in self._scopes:
+                logger.debug("Using the connection of the active transactional test scope.")
+                self.connection, self.scoped = self._scope_connection(key), True
+            elif self.pool is not None:
+                logger.debug("Checking out a pooled %s connection.", self.db_type)
+                self.connection = self.pool.acquire()
             else:
-                raise ValueError("Unsupported database type. Use 'postgres' or 'db2'.")
-            logger.info("Database connection established.")
+                logger.info("Connecting to the %s database.", self.db_type)
+                self.connection = self.open_connection(self.connection_string, self.db_type)
+                logger.info("Database connection established.")
+            self.cursor = self.connection.cursor()
         except Exception as e:
-            logger.error(f"Database connection failed: {e}")
+            logger.error("Database connection failed: %s", e)
             raise
 
     def disconnect(self):
         """
-        Close the database connection.
+        Close the database connection, or return it to the pool.
         """
+        connection, cursor, scoped = self.connection, self.cursor, self.scoped
+        self.cursor = self.connection = None
+        self.scoped = False
+        try:
+            if cursor:
+                cursor.close()
+        except Exception as e:
+            logger.error("Error closing database cursor: %s", e)
         try:
-            if self.cursor:
-                self.cursor.close()
-            if self.connection:
-                self.connection.close()
-            logger.info("Database connection closed.")
+            if scoped:
+                logger.debug("Leaving the transactional test scope's connection open.")
+            elif connection and self.pool is not None:
+                self.pool.release(connection)
+                logger.debug("Database connection returned to the pool.")
+            elif connection:
+                connection.close()
+                logger.info("Database connection closed.")
         except Exception as e:
-            logger.error(f"Error closing database connection: {e}")
+            logger.error("Error closing database connection: %s", e)
 
     def execute_query(self, query, params=None):
         """
@@ -78,7 +294,8 @@ class DatabaseUtility:
             list: Query results.
         """
         try:
-            logger.info(f"Executing query: {query} | Params: {params}")
+            logger.info("Executing query: %s | Params: %s", query, params)
+            started = time.perf_counter()
             if self.db_type == "postgres":
                 self.cursor.execute(query, params)
                 results = self.cursor.fetchall()
@@ -87,11 +304,224 @@ class DatabaseUtility:
                 results = self.cursor.fetchall()
             else:
                 raise ValueError("Unsupported database type.")
-            logger.info(f"Query executed successfully. Rows fetched: {len(results)}")
+            self._profile(query, params, time.perf_counter() - started, len(results))
+            logger.info("Query executed successfully. Rows fetched: %s", len(results))
+            logger.debug("Sample rows: %s", results[:self.log_sample_rows])
             return results
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def iter_query(self, query, params=None, batch_size=None):
+        """
+        Execute a SELECT and yield its rows in batches, keeping memory constant for large results.
+        PostgreSQL uses a server-side (named) cursor; DB2 fetches arraysize rows per round trip.
+        Outside a transactional test scope the transaction is committed (rolled back on error)
+        once iteration ends, so the cursor's snapshot is not held until the connection is released.
+        Args:
+            query (str): SQL query to execute.
+            params (tuple, optional): Parameters for the query.
+            batch_size (int, optional): Rows per fetch; defaults to DatabaseUtility.batch_size.
+        Returns:
+            iterator: Result rows.
+        """
+        batch_size = batch_size or self.batch_size
+        logger.info("Streaming query: %s | Params: %s | Batch size: %s", query, params, batch_size)
+        if self.db_type == "postgres":
+            # Named cursors live in the current transaction and are closed by commit/rollback.
+            cursor = self.connection.cursor(name=f"stream_{uuid.uuid4().hex}")
+            cursor.itersize = batch_size
+        elif self.db_type == "db2":
+            cursor = self.connection.cursor()
+            cursor.arraysize = batch_size
+        else:
+            raise ValueError("Unsupported database type.")
+        count, sample, seconds, failed = 0, [], 0.0, False
+        try:
+            started = time.perf_counter()
+            cursor.execute(query, params if self.db_type == "postgres" else (params or ()))
+            seconds += time.perf_counter() - started
+            while True:
+                # Only database time is profiled, not the time the caller spends between batches.
+                started = time.perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                seconds += time.perf_counter() - started
+                if not rows:
+                    break
+                if len(sample) < self.log_sample_rows:
+                    sample.extend(rows[:self.log_sample_rows - len(sample)])
+                count += len(rows)
+                yield from rows
+        except Exception as e:
+            failed = True
+            logger.error("Streaming query failed after %s rows: %s", count, e)
+            raise
+        finally:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.debug("Error closing streaming cursor: %s", e)
+            logger.info("Streamed %s rows.", count)
+            logger.debug("Sample rows: %s", sample)
+            if not failed:
+                self._profile(query, params, seconds, count)
+            if not self.scoped:
+                # End the cursor's transaction so its snapshot and locks are not held for the rest
+                # of the test; inside a test scope the scope owns the transaction.
+                self._end_stream_transaction(failed)
+
+    def _end_stream_transaction(self, failed):
+        try:
+            if failed:
+                self.connection.rollback()
+            else:
+                self.connection.commit()
+        except Exception as e:
+            logger.warning("Error ending streaming transaction: %s", e)
+
+    def iter_batches(self, query, params=None, batch_size=None):
+        """
+        Like iter_query(), but yields lists of up to batch_size rows.
+        Returns:
+            iterator: Lists of rows.
+        """
+        batch_size = batch_size or self.batch_size
+        rows = self.iter_query(query, params, batch_size)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def read_rows(source, columns=None):
+        """
+        Read rows from a CSV file (header row required), a JSON file (array of objects) or a
+        JSON lines file (.jsonl, one object per line).
+        Args:
+            source (str): File path.
+            columns (list, optional): Source fields to read, in order; defaults to all fields of the
+                header / first object.
+        Returns:
+            tuple: (field names, iterator of row tuples).
+        """
+        extension = os.path.splitext(source)[1].lower()
+        if extension == ".csv":
+            with open(source, newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f))
+            fields = list(columns or header)
+            indexes = [header.index(field) for field in fields]
+
+            def rows():
+                # Opened here so an unconsumed iterator holds no file handle.
+                with open(source, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    next(reader)
+                    for record in reader:
+                        yield tuple(record[i] for i in indexes)
+            return fields, rows()
+        if extension in (".json", ".jsonl"):
+            with open(source, encoding="utf-8") as f:
+                records = json.load(f) if extension == ".json" else [json.loads(line) for line in f if line.strip()]
+            if isinstance(records, dict):
+                records = [records]
+            fields = list(columns or (records[0].keys() if records else []))
+            return fields, (tuple(record.get(field) for field in fields) for record in records)
+        raise ValueError(f"Unsupported bulk source format: {source}")
+
+    def bulk_insert(self, table, rows=None, columns=None, source=None, source_columns=None,
+                    chunk_size=None, method=None):
+        """
+        Load many rows using the fastest path of the backend, committing every chunk_size rows.
+        PostgreSQL uses COPY FROM STDIN; DB2 uses array inserts (executemany); 'executemany' is
+        available everywhere.
+        Args:
+            table (str): Target table, optionally schema-qualified.
+            rows (iterable, optional): Row tuples, or dicts keyed by column name.
+            columns (list, optional): Target columns; defaults to the dict keys or the source's fields.
+            source (str, optional): CSV/JSON/JSONL file to load instead of rows (see read_rows()).
+            source_columns (list, optional): Source fields to read, mapped in order onto columns.
+            chunk_size (int, optional): Rows per chunk and commit; defaults to DatabaseUtility.bulk_chunk_size.
+            method (str, optional): 'copy' or 'executemany'; defaults to the backend's fastest path.
+        Returns:
+            dict: rows, seconds, rows_per_second and method.
+        """
+        if source is None and rows is None:
+            raise ValueError("bulk_insert needs rows or a source file.")
+        if source is not None:
+            fields, rows = self.read_rows(source, source_columns)
+            columns = columns or fields
+        else:
+            rows = iter(rows)
+            first = next(rows, None)
+            if first is None:
+                return {"rows": 0, "seconds": 0.0, "rows_per_second": 0.0, "method": None}
+            if isinstance(first, dict):
+                columns = columns or list(first.keys())
+                rows = (tuple(row.get(column) for column in columns) for row in itertools.chain([first], rows))
+            else:
+                rows = itertools.chain([first], rows)
+        if not columns:
+            raise ValueError("bulk_insert needs column names for tuple rows.")
+        chunk_size = chunk_size or self.bulk_chunk_size
+        method = method or ("copy" if self.db_type == "postgres" else "executemany")
+        if method == "copy" and self.db_type != "postgres":
+            raise ValueError("COPY is only available for PostgreSQL.")
+        logger.info("Bulk loading %s (%s) via %s in chunks of %s rows.", table, ", ".join(columns), method, chunk_size)
+        total, started = 0, time.perf_counter()
+        try:
+            with self._statement_guard():
+                while True:
+                    chunk = list(itertools.islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    chunk_started = time.perf_counter()
+                    if method == "copy":
+                        statement = self._copy_statement(table, columns)
+                        self.cursor.copy_expert(statement, _CsvStream(chunk))
+                    else:
+                        statement = self._insert_statement(table, columns)
+                        self.cursor.executemany(statement, chunk)
+                    self._commit()
+                    self._profile(statement, None, time.perf_counter() - chunk_started, len(chunk), explain=False)
+                    total += len(chunk)
+                    logger.debug("Bulk loaded %s rows into %s so far.", total, table)
+        except Exception as e:
+            logger.error("Bulk load into %s failed after %s loaded rows: %s", table, total, e)
             raise
+        seconds = time.perf_counter() - started
+        result = {
+            "rows": total,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(total / seconds, 1) if seconds else 0.0,
+            "method": method,
+        }
+        logger.info("Bulk loaded %s rows into %s in %.3fs (%s rows/s).", total, table, seconds, result["rows_per_second"])
+        return result
+
+    def _copy_statement(self, table, columns):
+        statement = pg_sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')").format(
+            pg_sql.Identifier(*table.split(".")),
+            pg_sql.SQL(", ").join(pg_sql.Identifier(column) for column in columns),
+        )
+        return statement.as_string(self.connection)
+
+    def _insert_statement(self, table, columns):
+        # Identifiers are quoted on every path so CSV headers with spaces load as they do through COPY.
+        if self.db_type == "postgres":
+            statement = pg_sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+                pg_sql.Identifier(*table.split(".")),
+                pg_sql.SQL(", ").join(pg_sql.Identifier(column) for column in columns),
+                pg_sql.SQL(", ").join(pg_sql.Placeholder() * len(columns)),
+            )
+            return statement.as_string(self.connection)
+        quoted_table = ".".join(self._quote_identifier(part) for part in table.split("."))
+        quoted_columns = ", ".join(self._quote_identifier(column) for column in columns)
+        return f"INSERT INTO {quoted_table} ({quoted_columns}) VALUES ({', '.join(['?'] * len(columns))})"
+
+    @staticmethod
+    def _quote_identifier(name):
+        return '"{}"'.format(name.replace('"', '""'))
 
     def execute_update(self, query, params=None):
         """
@@ -103,24 +533,77 @@ class DatabaseUtility:
             int: Number of rows affected.
         """
         try:
-            logger.info(f"Executing update: {query} | Params: {params}")
-            if self.db_type == "postgres":
-                self.cursor.execute(query, params)
-                self.connection.commit()
-                rowcount = self.cursor.rowcount
-            elif self.db_type == "db2":
-                self.cursor.execute(query, params or ())
-                self.connection.commit()
+            logger.info("Executing update: %s | Params: %s", query, params)
+            with self._statement_guard():
+                started = time.perf_counter()
+                if self.db_type == "postgres":
+                    self.cursor.execute(query, params)
+                elif self.db_type == "db2":
+                    self.cursor.execute(query, params or ())
+                else:
+                    raise ValueError("Unsupported database type.")
                 rowcount = self.cursor.rowcount
-            else:
-                raise ValueError("Unsupported database type.")
-            logger.info(f"Update executed successfully. Rows affected: {rowcount}")
+                # Profile (and EXPLAIN) inside the statement's transaction, before it is committed.
+                self._profile(query, params, time.perf_counter() - started, rowcount)
+                self._commit()
+            logger.info("Update executed successfully. Rows affected: %s", rowcount)
             return rowcount
         except Exception as e:
-            logger.error(f"Update execution failed: {e}")
-            if self.connection:
-                self.connection.rollback()
+            logger.error("Update execution failed: %s", e)
+            raise
+
+    def _profile(self, query, params, seconds, rows, explain=True):
+        if self.profiler is None:
+            return
+        if self.profiler.record(query, seconds, rows) and explain:
+            self.profiler.attach_plan(query, self._explain(query, params))
+
+    def _explain(self, query, params):
+        # Plain EXPLAIN (no ANALYZE) plans without executing; a savepoint keeps a failed EXPLAIN
+        # from aborting the surrounding transaction. Callers run it while the statement's own
+        # transaction is still open, so it never leaves a new one idle.
+        if self.db_type != "postgres" or not _EXPLAINABLE.match(query):
+            return ["EXPLAIN capture is only available for PostgreSQL DML statements."]
+        try:
+            self._run(self.connection, "SAVEPOINT explain_plan")
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN {query}", params)
+            plan = [row[0] for row in cursor.fetchall()]
+            self._run(self.connection, "RELEASE SAVEPOINT explain_plan")
+            return plan
+        except Exception as e:
+            self._run(self.connection, "ROLLBACK TO SAVEPOINT explain_plan")
+            return [f"EXPLAIN failed: {e}"]
+        finally:
+            cursor.close()
+
+    def _commit(self):
+        # Inside a transactional test scope the scope owns the transaction and rolls it back.
+        if not self.scoped:
+            self.connection.commit()
+
+    @contextlib.contextmanager
+    def _statement_guard(self):
+        # Undo a failed write: a rollback normally, a statement savepoint inside a test scope so the
+        # scope's transaction survives the error.
+        if not self.scoped:
+            try:
+                yield
+            except Exception:
+                if self.connection:
+                    self.connection.rollback()
+                raise
+            return
+        self._run(self.connection, SAVEPOINT_STATEMENTS[self.db_type].format("statement"))
+        try:
+            yield
+        except Exception:
+            self._run(self.connection, "ROLLBACK TO SAVEPOINT statement")
             raise
+        self._run(self.connection, "RELEASE SAVEPOINT statement")
 
     def fetch_one(self):
         """
@@ -130,10 +613,10 @@ class DatabaseUtility:
         """
         try:
             row = self.cursor.fetchone()
-            logger.info(f"Fetched one row: {row}")
+            logger.info("Fetched one row: %s", row)
             return row
         except Exception as e:
-            logger.error(f"Fetch one failed: {e}")
+            logger.error("Fetch one failed: %s", e)
             raise
 
     def fetch_all(self):
@@ -144,10 +627,11 @@ class DatabaseUtility:
         """
         try:
             rows = self.cursor.fetchall()
-            logger.info(f"Fetched all rows: {rows}")
+            logger.info("Fetched %s rows.", len(rows))
+            logger.debug("Sample rows: %s", rows[:self.log_sample_rows])
             return rows
         except Exception as e:
-            logger.error(f"Fetch all failed: {e}")
+            logger.error("Fetch all failed: %s", e)
             raise
 
     def __enter__(self):
@@ -0,0 +1,263 @@
+import threading
+import time
+from urllib.parse import urlsplit
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from utils.logger_utility import logger
+
+
+class DriverPoolUtility:
+    """
+    Per-process pool of WebDriver sessions that are reset and reused between tests.
+    Session scope under pytest-xdist is per worker, so each worker owns one pool.
+    Optionally keeps warm spare sessions launched on a background thread so replacing a
+    retired or crashed session does not happen on the test's critical path.
+    """
+
+    def __init__(self, factory, base_url=None, max_reuse=25, spares=0):
+        """
+        Initialize the pool.
+        Args:
+            factory (callable): Zero-argument callable returning a ready WebDriver
+                (already maximized and pointed at the base URL).
+            base_url (str, optional): URL every reused session is returned to after a reset.
+            max_reuse (int): Number of tests a session may serve before it is replaced.
+                0 or None means unlimited.
+            spares (int): Number of ready sessions to keep launched ahead of demand. Warming
+                starts right away, so create the pool ahead of the first test that needs it.
+        """
+        self.factory = factory
+        self.base_url = base_url
+        self.max_reuse = max_reuse
+        self._idle = []
+        self._uses = {}
+        self._home_handles = {}
+        self.spares = spares or 0
+        self._spares = []
+        self._launching = 0
+        self._warmer = None
+        self._lock = threading.Condition()
+        self._closed = False
+        self._stats = {"reused": 0, "spare_hits": 0, "spare_misses": 0, "spare_wait_seconds": 0.0, "launched": 0}
+        self.start_warming()
+
+    def start_warming(self):
+        """
+        Start the background thread that keeps `spares` sessions ready. Called on creation.
+        """
+        with self._lock:
+            if self.spares <= 0 or self._warmer is not None:
+                return
+            # Reserve the first launch now so an acquire() racing the thread start waits for it.
+            self._launching += 1
+            self._warmer = threading.Thread(target=self._warm_loop, name="driver-pool-warmer", daemon=True)
+        self._warmer.start()
+        logger.info("Pre-warming %s spare driver session(s).", self.spares)
+
+    def acquire(self):
+        """
+        Hand out an idle session, replacing broken ones, or launch a new session.
+        Returns:
+            WebDriver: A session positioned on the base URL.
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                logger.debug("Reusing pooled driver session %s", driver.session_id)
+                self._stats["reused"] += 1
+                return driver
+            logger.warning("Pooled driver session is broken, replacing it.")
+            self._discard(driver)
+        driver = self._take_spare()
+        if driver is not None:
+            return driver
+        return self._launch()
+
+    def stats(self):
+        """
+        Get reuse and warm-spare counters, used to tune the number of spares.
+        Returns:
+            dict: reused, spare_hits, spare_misses, spare_wait_seconds and launched counts.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def release(self, driver):
+        """
+        Return a session to the pool after resetting its state.
+        Sessions that exceeded max_reuse or fail to reset are quit instead.
+        Args:
+            driver (WebDriver): Session previously obtained from acquire().
+        """
+        key = id(driver)
+        self._uses[key] = self._uses.get(key, 0) + 1
+        if self._closed or (self.max_reuse and self._uses[key] >= self.max_reuse):
+            logger.info("Retiring driver session after %s uses.", self._uses[key])
+            self._discard(driver)
+            return
+        try:
+            self.reset_driver(driver)
+        except WebDriverException as e:
+            logger.warning("Driver reset failed, discarding session: %s", e)
+            self._discard(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def reset_driver(self, driver):
+        """
+        Clear per-test browser state: alerts, extra windows, frame focus, cookies and storage.
+        Args:
+            driver (WebDriver): Session to reset.
+        """
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        home = self._home_handles.get(id(driver))
+        handles = driver.window_handles
+        if home not in handles:
+            home = handles[0]
+            self._home_handles[id(driver)] = home
+        for handle in handles:
+            if handle != home:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(home)
+        driver.switch_to.default_content()
+        self._clear_site_data(driver)
+        if self.base_url:
+            if self._origin(driver.current_url) != self._origin(self.base_url):
+                # Storage is per origin: the test ended elsewhere, so base_url's storage is still set.
+                # Clear it on base_url's origin, then load the page again on a clean slate.
+                driver.get(self.base_url)
+                self._clear_site_data(driver)
+            driver.get(self.base_url)
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url or "")
+        return parts.scheme, parts.netloc
+
+    @staticmethod
+    def _clear_site_data(driver):
+        """
+        Clear cookies plus local and session storage of the driver's current origin.
+        Args:
+            driver (WebDriver): Session to clear.
+        """
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium can drop cookies of every origin, not only the current one.
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except WebDriverException:
+                pass
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Check that a session still responds.
+        Args:
+            driver (WebDriver): Session to check.
+        Returns:
+            bool: True if the session answered, else False.
+        """
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """
+        Quit every idle session. Called once at the end of the worker's session.
+        """
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+            idle, self._idle = self._idle, []
+            spares, self._spares = self._spares, []
+        if self._warmer is not None:
+            self._warmer.join(timeout=60)
+        for driver in idle + spares:
+            self._discard(driver)
+        logger.info("Driver pool stats: %s", self.stats())
+
+    def _take_spare(self):
+        with self._lock:
+            if not self._spares and not self._launching:
+                if self.spares > 0:
+                    self._stats["spare_misses"] += 1
+                return None
+            started = time.monotonic()
+            while not self._spares and self._launching and not self._closed:
+                self._lock.wait(timeout=1)
+            if not self._spares:
+                self._stats["spare_misses"] += 1
+                return None
+            driver = self._spares.pop(0)
+            self._stats["spare_hits"] += 1
+            self._stats["spare_wait_seconds"] += time.monotonic() - started
+            self._lock.notify_all()
+        if self.is_healthy(driver):
+            logger.debug("Using warm spare driver session %s", driver.session_id)
+            return driver
+        logger.warning("Warm spare driver session is broken, discarding it.")
+        self._discard(driver)
+        return None
+
+    def _warm_loop(self):
+        failures = 0
+        reserved = True  # start_warming() counted the first launch
+        while True:
+            with self._lock:
+                if not reserved:
+                    while not self._closed and len(self._spares) + self._launching >= self.spares:
+                        self._lock.wait()
+                    self._launching += 1
+                reserved = False
+                if self._closed:
+                    self._launching -= 1
+                    self._lock.notify_all()
+                    return
+            driver = None
+            try:
+                driver = self._launch()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logger.warning("Failed to pre-warm driver session: %s", e)
+            with self._lock:
+                self._launching -= 1
+                if driver is not None and not self._closed:
+                    self._spares.append(driver)
+                    driver = None
+                self._lock.notify_all()
+            if driver is not None:
+                self._discard(driver)
+            if failures:
+                # Back off so a hub that refuses sessions is not hammered.
+                time.sleep(min(2 ** failures, 30))
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._stats["launched"] += 1
+        self._home_handles[id(driver)] = driver.current_window_handle
+        logger.info("Launched new pooled driver session %s", driver.session_id)
+        return driver
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        self._home_handles.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting driver session: %s", e)
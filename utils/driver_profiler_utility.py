@@ -0,0 +1,181 @@
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from utils.logger_utility import logger
+
+OUTSIDE_TEST = "<outside test>"
+
+
+class DriverProfilerUtility:
+    """
+    Opt-in profiler for WebDriver commands. Wraps a driver's `execute` (the single entry point
+    for local and Remote drivers) and records command name, count and latency, attributed to
+    the running test and to the page-object / WebUtility method that issued the command.
+    """
+
+    _PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pages")
+    _WEB_UTILITY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web_utility.py")
+
+    def __init__(self, output_dir=os.path.join("reports", "driver_profile")):
+        """
+        Initialize the profiler.
+        Args:
+            output_dir (str): Directory receiving one JSON file per process (xdist worker).
+        """
+        self.output_dir = output_dir
+        self.current_test = OUTSIDE_TEST
+        self.tests = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, driver):
+        """
+        Start recording commands issued through the driver. Safe to call repeatedly on pooled drivers.
+        Args:
+            driver (WebDriver): Local or Remote WebDriver instance.
+        """
+        if getattr(driver, "_driver_profiler", None) is self:
+            return driver
+        original_execute = driver.execute
+        profiler = self
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                profiler.record(driver_command, time.perf_counter() - started, profiler._origin())
+
+        driver.execute = execute
+        driver._driver_profiler = self
+        return driver
+
+    def begin_test(self, nodeid):
+        """
+        Attribute subsequent commands to a test.
+        """
+        self.current_test = nodeid
+
+    def end_test(self):
+        """
+        Stop attributing commands to the current test.
+        Returns:
+            dict: The finished test's totals ({"commands": int, "seconds": float, ...}).
+        """
+        nodeid, self.current_test = self.current_test, OUTSIDE_TEST
+        return self.tests.get(nodeid, self._empty())
+
+    def record(self, command, seconds, origin):
+        """
+        Record one executed command.
+        Args:
+            command (str): WebDriver command name.
+            seconds (float): Round-trip latency.
+            origin (str): Issuing method, e.g. 'HomePage.click_home_link > WebUtility.click'.
+        """
+        with self._lock:
+            stats = self.tests.setdefault(self.current_test, self._empty())
+            stats["commands"] += 1
+            stats["seconds"] += seconds
+            for key, name in (("by_command", command), ("by_origin", origin)):
+                entry = stats[key].setdefault(name, [0, 0.0])
+                entry[0] += 1
+                entry[1] += seconds
+
+    def write(self, name):
+        """
+        Write this process's measurements as JSON.
+        Args:
+            name (str): File stem, typically the xdist worker id.
+        Returns:
+            str: Path of the written file.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{name}.json")
+        with open(path, "w") as f:
+            json.dump({"tests": self.tests}, f, indent=2)
+        return path
+
+    @classmethod
+    def merge(cls, output_dir):
+        """
+        Merge the per-process files found in output_dir.
+        Returns:
+            dict: {"tests": {...}, "commands": {name: [count, seconds]}} across all workers.
+        """
+        merged = {"tests": {}, "commands": {}}
+        for path in sorted(glob.glob(os.path.join(output_dir, "*.json"))):
+            with open(path) as f:
+                tests = json.load(f).get("tests", {})
+            for nodeid, stats in tests.items():
+                target = merged["tests"].setdefault(nodeid, cls._empty())
+                target["commands"] += stats["commands"]
+                target["seconds"] += stats["seconds"]
+                for key in ("by_command", "by_origin"):
+                    for name, (count, seconds) in stats[key].items():
+                        entry = target[key].setdefault(name, [0, 0.0])
+                        entry[0] += count
+                        entry[1] += seconds
+                for name, (count, seconds) in stats["by_command"].items():
+                    entry = merged["commands"].setdefault(name, [0, 0.0])
+                    entry[0] += count
+                    entry[1] += seconds
+        return merged
+
+    @staticmethod
+    def format_table(merged, limit=15):
+        """
+        Render merged measurements as summary lines: slowest tests, then busiest commands.
+        Returns:
+            list: Lines of text.
+        """
+        lines = [f"{'test':<80} {'commands':>9} {'driver s':>9}"]
+        tests = sorted(merged["tests"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+        for nodeid, stats in tests[:limit]:
+            lines.append(f"{nodeid[-80:]:<80} {stats['commands']:>9} {stats['seconds']:>9.3f}")
+        lines.append("")
+        lines.append(f"{'command':<40} {'count':>9} {'total s':>9} {'avg ms':>9}")
+        commands = sorted(merged["commands"].items(), key=lambda item: item[1][1], reverse=True)
+        for name, (count, seconds) in commands[:limit]:
+            lines.append(f"{name:<40} {count:>9} {seconds:>9.3f} {seconds / count * 1000:>9.1f}")
+        return lines
+
+    @staticmethod
+    def check_budget(stats, max_commands=None, max_seconds=None):
+        """
+        Compare a test's totals with its declared budget.
+        Args:
+            stats (dict): Totals returned by DriverProfilerUtility.end_test().
+            max_commands (int, optional): Maximum WebDriver round trips.
+            max_seconds (float, optional): Maximum time spent in WebDriver commands.
+        Returns:
+            list: Human-readable violations; empty if within budget.
+        """
+        violations = []
+        if max_commands is not None and stats["commands"] > max_commands:
+            violations.append(f"{stats['commands']} WebDriver commands exceed budget of {max_commands}")
+        if max_seconds is not None and stats["seconds"] > max_seconds:
+            violations.append(f"{stats['seconds']:.3f}s in WebDriver commands exceeds budget of {max_seconds}s")
+        if violations:
+            logger.warning("Driver budget exceeded: %s", "; ".join(violations))
+        return violations
+
+    @staticmethod
+    def _empty():
+        return {"commands": 0, "seconds": 0.0, "by_command": {}, "by_origin": {}}
+
+    def _origin(self):
+        page = utility = None
+        frame = sys._getframe(2)
+        # Innermost page-object method, outermost WebUtility method (the one the page called).
+        while frame is not None and page is None:
+            filename = frame.f_code.co_filename
+            if filename == self._WEB_UTILITY_FILE:
+                utility = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            elif filename.startswith(self._PAGES_DIR):
+                page = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            frame = frame.f_back
+        return " > ".join(part for part in (page, utility) if part) or "<direct>"
+
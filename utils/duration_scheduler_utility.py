@@ -0,0 +1,134 @@
+import json
+import os
+import re
+import statistics
+from utils.logger_utility import logger
+
+# Suffix pytest-xdist appends to node ids of tests in an xdist_group.
+_GROUP_SUFFIX = re.compile(r"@lpt\d+$")
+
+
+class DurationSchedulerUtility:
+    """
+    Duration-aware test scheduling for pytest-xdist.
+    Keeps a local store of per-test durations and, on later runs, assigns tests to workers
+    longest-processing-time-first (LPT) using xdist_group markers with `--dist loadgroup`.
+    """
+
+    DEFAULT_ESTIMATE = 1.0
+    SMOOTHING = 0.5
+
+    def __init__(self, timings_file=".test_timings.json"):
+        """
+        Initialize the scheduler and load historical timings.
+        Args:
+            timings_file (str): JSON file mapping node ids to smoothed durations in seconds.
+        """
+        self.timings_file = timings_file
+        self.timings = {}
+        self.measured = {}
+        if os.path.exists(timings_file):
+            try:
+                with open(timings_file) as f:
+                    self.timings = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable timings file %s: %s", timings_file, e)
+
+    @staticmethod
+    def group_name(index):
+        """
+        Name of the xdist group for a worker slot.
+        """
+        return f"lpt{index}"
+
+    @staticmethod
+    def base_nodeid(nodeid):
+        """
+        Strip the xdist group suffix from a node id.
+        """
+        return _GROUP_SUFFIX.sub("", nodeid)
+
+    def estimate(self, nodeid):
+        """
+        Estimate a test's duration. Unknown tests fall back to the mean of their other
+        parametrizations, then of their module, then the median of all known tests.
+        Args:
+            nodeid (str): Test node id.
+        Returns:
+            float: Estimated seconds.
+        """
+        if nodeid in self.timings:
+            return self.timings[nodeid]
+        function_id = nodeid.split("[", 1)[0]
+        module_id = nodeid.split("::", 1)[0]
+        for prefix in (function_id, module_id + "::"):
+            siblings = [seconds for known, seconds in self.timings.items() if known.startswith(prefix)]
+            if siblings:
+                return statistics.mean(siblings)
+        if self.timings:
+            return statistics.median(self.timings.values())
+        return self.DEFAULT_ESTIMATE
+
+    def plan(self, nodeids, workers):
+        """
+        Assign tests to workers longest-processing-time-first.
+        Args:
+            nodeids (list): Node ids to schedule.
+            workers (int): Number of workers.
+        Returns:
+            tuple: (assignment {nodeid: worker index}, estimated load per worker list)
+        """
+        workers = max(int(workers), 1)
+        loads = [0.0] * workers
+        assignment = {}
+        for nodeid in sorted(nodeids, key=lambda n: (-self.estimate(n), n)):
+            slot = min(range(workers), key=lambda i: (loads[i], i))
+            assignment[nodeid] = slot
+            loads[slot] += self.estimate(nodeid)
+        return assignment, loads
+
+    def record(self, nodeid, seconds):
+        """
+        Accumulate measured time (setup, call and teardown) for a test in this run.
+        """
+        nodeid = self.base_nodeid(nodeid)
+        self.measured[nodeid] = self.measured.get(nodeid, 0.0) + seconds
+
+    def summarize(self, workers, busy_by_worker, wall_time, path=os.path.join("reports", "schedule_summary.json")):
+        """
+        Compare the makespan predicted from stored timings with this run's actual one and write it as JSON.
+        Call before save(), so the prediction uses the timings the schedule was built from.
+        Args:
+            workers (int): Number of workers used.
+            busy_by_worker (dict): Measured test seconds per worker id.
+            wall_time (float): Session wall time in seconds.
+            path (str): Output file.
+        Returns:
+            dict: workers, tests, predicted_makespan, actual_makespan and wall_time.
+        """
+        _, loads = self.plan(list(self.measured), workers)
+        summary = {
+            "workers": max(int(workers), 1),
+            "tests": len(self.measured),
+            "predicted_makespan": round(max(loads, default=0.0), 3),
+            "actual_makespan": round(max(busy_by_worker.values(), default=0.0), 3),
+            "wall_time": round(wall_time, 3),
+            "busy_by_worker": {worker: round(seconds, 3) for worker, seconds in sorted(busy_by_worker.items())},
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def save(self):
+        """
+        Merge this run's measurements into the store, smoothing against previous values.
+        """
+        for nodeid, seconds in self.measured.items():
+            previous = self.timings.get(nodeid)
+            self.timings[nodeid] = seconds if previous is None else (
+                self.SMOOTHING * seconds + (1 - self.SMOOTHING) * previous
+            )
+        with open(self.timings_file, "w") as f:
+            json.dump(self.timings, f, indent=2, sort_keys=True)
+        logger.info("Saved timings for %s tests to %s", len(self.measured), self.timings_file)
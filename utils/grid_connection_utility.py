@@ -0,0 +1,195 @@
+import os
+import threading
+import time
+import urllib3
+from selenium.webdriver.remote.client_config import ClientConfig
+from utils.logger_utility import logger
+
+
+class _SharedPoolManager(urllib3.PoolManager):
+    """
+    PoolManager shared by every Remote session of a process. RemoteConnection.close()
+    calls clear() when a session quits; that must not drop connections other sessions
+    are about to reuse, so clear() is a no-op and shutdown() really closes the pool.
+    """
+
+    def clear(self):
+        pass
+
+    def shutdown(self):
+        super().clear()
+
+
+class GridConnectionUtility:
+    """
+    Shared keep-alive HTTP transport for Remote WebDriver sessions against Selenium Grid.
+    One connection pool per process (xdist worker) is reused across all of its sessions,
+    so commands to the hub skip TCP connection setup. The pool takes the sessions' TLS settings;
+    sessions behind a proxy keep the pool Selenium built for them.
+    """
+
+    pool_size = None
+    timeout = 120
+    retries = 2
+    ready_timeout = 300
+    _pool_manager = None
+    _pool_tls_args = {}
+    _ready = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, pool_size=None, timeout=None, retries=None, ready_timeout=None):
+        """
+        Set pool parameters for this process. Must be called before the first session is created.
+        Args:
+            pool_size (int, optional): Connections kept per hub host; defaults to the xdist worker count (minimum 2).
+            timeout (float, optional): Per-request timeout in seconds.
+            retries (int, optional): Connection-level retries for failed requests.
+            ready_timeout (float, optional): Seconds to wait for the grid readiness barrier.
+        """
+        if pool_size is not None:
+            cls.pool_size = pool_size
+        if timeout is not None:
+            cls.timeout = timeout
+        if retries is not None:
+            cls.retries = retries
+        if ready_timeout is not None:
+            cls.ready_timeout = ready_timeout
+
+    @staticmethod
+    def ready_file():
+        """
+        Path of the readiness barrier written by run_tests.py while it boots the grid, if any.
+        Returns:
+            str: Value of GRID_READY_FILE, or None when the grid is assumed to be up already.
+        """
+        return os.environ.get("GRID_READY_FILE") or None
+
+    @classmethod
+    def wait_until_ready(cls):
+        """
+        Block until run_tests.py reports the grid as ready. Returns immediately without a barrier
+        or once readiness has been seen by this process.
+        Raises:
+            RuntimeError: If the grid failed to start.
+            TimeoutError: If no result is reported within ready_timeout.
+        """
+        path = cls.ready_file()
+        if cls._ready or not path:
+            return
+        deadline = time.monotonic() + cls.ready_timeout
+        delay = 0.1
+        logger.info("Waiting for Selenium Grid readiness barrier %s", path)
+        while not os.path.exists(path):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Selenium Grid was not reported ready within {cls.ready_timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        with open(path) as f:
+            state = dict(line.rstrip("\n").split("=", 1) for line in f if "=" in line)
+        if state.get("GRID_STATUS") != "ready":
+            raise RuntimeError(f"Selenium Grid failed to start: {state.get('GRID_DETAIL', 'unknown error')}")
+        cls._ready = True
+        logger.info("Selenium Grid is ready")
+
+    @classmethod
+    def client_config(cls, grid_url):
+        """
+        Build the ClientConfig used for the session handshake.
+        Args:
+            grid_url (str): Hub URL.
+        Returns:
+            ClientConfig: Keep-alive configuration with the configured timeout.
+        """
+        return ClientConfig(remote_server_addr=grid_url, keep_alive=True, timeout=cls.timeout)
+
+    @classmethod
+    def pool_manager(cls, client_config=None):
+        """
+        Get (creating on first use) the process-wide connection pool.
+        Args:
+            client_config (ClientConfig, optional): Session config whose TLS settings (ca_certs,
+                ignore_certificates) the pool is created with.
+        Returns:
+            urllib3.PoolManager: Shared pool manager.
+        """
+        with cls._lock:
+            if cls._pool_manager is None:
+                size = cls.pool_size or max(int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1)), 2)
+                cls._pool_tls_args = cls._tls_args(client_config)
+                cls._pool_manager = _SharedPoolManager(
+                    num_pools=4,
+                    maxsize=size,
+                    block=False,
+                    timeout=urllib3.Timeout(total=cls.timeout),
+                    retries=urllib3.Retry(total=cls.retries, connect=cls.retries, read=0, redirect=False),
+                    **cls._pool_tls_args,
+                )
+                logger.info("Created shared grid connection pool (maxsize=%s)", size)
+            return cls._pool_manager
+
+    @classmethod
+    def attach(cls, driver):
+        """
+        Route a Remote driver's commands through the shared pool.
+        Args:
+            driver (WebDriver): Remote WebDriver instance.
+        Returns:
+            WebDriver: The same driver.
+        """
+        executor = driver.command_executor
+        own_pool = getattr(executor, "_conn", None)
+        if own_pool is not None and type(own_pool) is not urllib3.PoolManager:
+            # Selenium built a ProxyManager / SOCKSProxyManager from ClientConfig.proxy or the environment.
+            logger.info("Grid connection goes through a proxy; keeping the session's own pool.")
+            return driver
+        client_config = getattr(executor, "_client_config", None)
+        shared_pool = cls.pool_manager(client_config)
+        if cls._tls_args(client_config) != cls._pool_tls_args:
+            logger.info("Grid session has different TLS settings than the shared pool; keeping its own pool.")
+            return driver
+        executor._conn = shared_pool
+        if own_pool is not None and own_pool is not executor._conn:
+            own_pool.clear()
+        return driver
+
+    @staticmethod
+    def _tls_args(client_config):
+        # The certificate settings Selenium's RemoteConnection applies to its own pool.
+        if client_config is None:
+            return {}
+        if client_config.ignore_certificates:
+            return {"cert_reqs": "CERT_NONE"}
+        if client_config.ca_certs:
+            return {"cert_reqs": "CERT_REQUIRED", "ca_certs": client_config.ca_certs}
+        return {}
+
+    @classmethod
+    def stats(cls):
+        """
+        Get connection reuse statistics for this process.
+        Returns:
+            dict: requests, connections opened and reuse_ratio (share of requests on a reused connection).
+        """
+        requests_sent = connections = 0
+        if cls._pool_manager is not None:
+            pools = cls._pool_manager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_sent += pool.num_requests
+                    connections += pool.num_connections
+        reuse_ratio = 1 - connections / requests_sent if requests_sent else 0.0
+        return {"requests": requests_sent, "connections": connections, "reuse_ratio": round(reuse_ratio, 3)}
+
+    @classmethod
+    def close(cls):
+        """
+        Log reuse statistics and close the shared pool.
+        """
+        if cls._pool_manager is None:
+            return
+        logger.info("Grid connection pool stats: %s", cls.stats())
+        with cls._lock:
+            pool_manager, cls._pool_manager = cls._pool_manager, None
+        pool_manager.shutdown()
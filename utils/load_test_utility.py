@@ -0,0 +1,310 @@
+import http.server
+import json
+import os
+import statistics
+import threading
+import time
+from datetime import datetime
+from utils.api_utility import APIUtility
+from utils.logger_utility import logger
+
+
+class StubHTTPServer:
+    """
+    Local stand-in HTTP server for hermetic load runs. Serves canned JSON responses per path
+    from a background thread; use as a context manager.
+    """
+
+    def __init__(self, routes=None, host="127.0.0.1", port=0):
+        """
+        Initialize the stub server.
+        Args:
+            routes (dict, optional): {path: (status, body, delay_seconds)}. Unknown paths return 404.
+                Defaults to '/' answering 200 with a small JSON body.
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free one.
+        """
+        self.routes = routes or {"/": (200, {"status": "ok"}, 0)}
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        routes = self.routes
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY each keep-alive
+            # response would stall on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                status, body, delay = routes.get(self.path.split("?", 1)[0], (404, {"error": "not found"}, 0))
+                if delay:
+                    time.sleep(delay)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-http", daemon=True)
+        self._thread.start()
+        logger.info("Stub HTTP server listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class LoadTestUtility:
+    """
+    Drives an APIUtility-based scenario at a target concurrency (closed loop) or request rate
+    (open loop) for a fixed duration and summarizes throughput, latency percentiles, error rate
+    and status codes. In rate mode latency is measured from each request's scheduled start,
+    so a slow server is not hidden by requests that were sent late.
+    """
+
+    def __init__(self, scenario, base_url, concurrency=10, duration=10, rate=None, warmup=0, api_utility=None):
+        """
+        Initialize the load run.
+        Args:
+            scenario (callable): Called as scenario(api_utility, base_url) and returning a Response;
+                an exception counts as an error.
+            base_url (str): Target base URL passed to the scenario.
+            concurrency (int): Worker threads issuing requests.
+            duration (float): Measured seconds.
+            rate (float, optional): Target requests per second across all workers; unlimited if None.
+            warmup (float): Seconds run before measuring (connections are opened, not recorded).
+            api_utility (APIUtility, optional): Utility the scenario uses; defaults to a new instance.
+        """
+        self.scenario = scenario
+        self.base_url = base_url
+        self.concurrency = max(int(concurrency), 1)
+        self.duration = duration
+        self.rate = rate
+        self.warmup = warmup
+        self.api_utility = api_utility or APIUtility()
+        self._lock = threading.Lock()
+        self._next_slot = 0
+
+    def run(self):
+        """
+        Execute the load run.
+        Returns:
+            dict: Summary with requests, throughput, error_rate, latency_ms percentiles and status codes.
+        """
+        if APIUtility.pool_size < self.concurrency:
+            logger.warning("Concurrency %s exceeds the API pool size %s; extra connections will not be reused.",
+                           self.concurrency, APIUtility.pool_size)
+        started = time.perf_counter()
+        measure_from = started + self.warmup
+        deadline = measure_from + self.duration
+        samples = [[] for _ in range(self.concurrency)]
+        threads = [
+            threading.Thread(target=self._worker, args=(started, measure_from, deadline, samples[i]),
+                             name=f"load-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        logger.info("Load run: concurrency=%s rate=%s duration=%ss warmup=%ss against %s",
+                    self.concurrency, self.rate, self.duration, self.warmup, self.base_url)
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = max(min(time.perf_counter(), deadline) - measure_from, 1e-9)
+        return self.summarize([sample for worker in samples for sample in worker], elapsed)
+
+    def summarize(self, samples, elapsed):
+        """
+        Aggregate raw samples.
+        Args:
+            samples (list): (latency_seconds, status_code or None, error name or None) tuples.
+            elapsed (float): Measured wall time in seconds.
+        Returns:
+            dict: Run summary.
+        """
+        latencies = sorted(latency for latency, _, _ in samples)
+        statuses, errors = {}, {}
+        failed = 0
+        for _, status, error in samples:
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+            else:
+                statuses[str(status)] = statuses.get(str(status), 0) + 1
+            if error or status >= 400:
+                failed += 1
+        total = len(samples)
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "base_url": self.base_url,
+            "concurrency": self.concurrency,
+            "target_rate": self.rate,
+            "duration": round(elapsed, 3),
+            "requests": total,
+            "throughput": round(total / elapsed, 2),
+            "error_rate": round(failed / total, 4) if total else 0.0,
+            "latency_ms": self._percentiles(latencies),
+            "status_codes": dict(sorted(statuses.items())),
+            "errors": errors,
+        }
+
+    @staticmethod
+    def write(summary, path):
+        """
+        Write a summary as JSON.
+        Returns:
+            str: The written path.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        logger.info("Load results written to %s", path)
+        return path
+
+    @staticmethod
+    def compare(summary, baseline, tolerance=0.1, max_error_rate_increase=0.01):
+        """
+        Compare a run with a stored baseline.
+        Args:
+            summary (dict): Current run summary.
+            baseline (dict): Baseline summary.
+            tolerance (float): Allowed relative throughput drop and p95/p99 latency increase.
+            max_error_rate_increase (float): Allowed absolute error rate increase.
+        Returns:
+            list: Human-readable regressions; empty if within tolerance.
+        """
+        regressions = []
+        if summary["throughput"] < baseline["throughput"] * (1 - tolerance):
+            regressions.append(f"throughput {summary['throughput']}/s < baseline {baseline['throughput']}/s")
+        for key in ("p95", "p99"):
+            current, previous = summary["latency_ms"].get(key), baseline["latency_ms"].get(key)
+            if current is not None and previous is not None and current > previous * (1 + tolerance):
+                regressions.append(f"{key} latency {current}ms > baseline {previous}ms")
+        if summary["error_rate"] > baseline["error_rate"] + max_error_rate_increase:
+            regressions.append(f"error rate {summary['error_rate']:.2%} > baseline {baseline['error_rate']:.2%}")
+        if regressions:
+            logger.warning("Load regressions against baseline: %s", "; ".join(regressions))
+        return regressions
+
+    @staticmethod
+    def load_baseline(path):
+        """
+        Read a baseline summary.
+        Returns:
+            dict: Baseline, or None if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    @classmethod
+    def evaluate(cls, summary, results_path, baseline_path, tolerance=0.1, update_baseline=False):
+        """
+        Write the results and compare them with the baseline, or store them as the new baseline.
+        A missing baseline is created from this run; one recorded with a different concurrency
+        or target rate is not compared.
+        Args:
+            summary (dict): Run summary.
+            results_path (str): Results file.
+            baseline_path (str): Baseline file.
+            tolerance (float): See compare().
+            update_baseline (bool): Replace the baseline with this run instead of comparing.
+        Returns:
+            list: Regressions; empty if within tolerance or the baseline was (re)written.
+        """
+        cls.write(summary, results_path)
+        baseline = None if update_baseline else cls.load_baseline(baseline_path)
+        if baseline is None:
+            cls.write(summary, baseline_path)
+            return []
+        if (baseline.get("concurrency"), baseline.get("target_rate")) != (summary["concurrency"], summary["target_rate"]):
+            logger.warning("Baseline %s was recorded with different load parameters; not comparing.", baseline_path)
+            return []
+        return cls.compare(summary, baseline, tolerance=tolerance)
+
+    @staticmethod
+    def format_summary(summary):
+        """
+        Render a summary as lines of text.
+        Returns:
+            list: Lines of text.
+        """
+        latency = summary["latency_ms"]
+        return [
+            f"requests {summary['requests']} in {summary['duration']}s -> {summary['throughput']} req/s, "
+            f"error rate {summary['error_rate']:.2%}",
+            "latency ms: " + ", ".join(f"{key} {value}" for key, value in latency.items()),
+            "status codes: " + (", ".join(f"{code}: {count}" for code, count in summary["status_codes"].items()) or "-"),
+        ] + ([f"errors: {summary['errors']}"] if summary["errors"] else [])
+
+    def _worker(self, started, measure_from, deadline, samples):
+        while True:
+            scheduled = self._schedule(started)
+            if scheduled is not None:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            sent = time.perf_counter()
+            if sent >= deadline:
+                return
+            status = error = None
+            try:
+                status = self.scenario(self.api_utility, self.base_url).status_code
+            except Exception as e:
+                error = type(e).__name__
+            finished = time.perf_counter()
+            if sent >= measure_from and finished <= deadline:
+                samples.append((finished - (scheduled if scheduled is not None else sent), status, error))
+
+    def _schedule(self, started):
+        if not self.rate:
+            return None
+        with self._lock:
+            slot, self._next_slot = self._next_slot, self._next_slot + 1
+        return started + slot / self.rate
+
+    @staticmethod
+    def _percentiles(latencies):
+        if not latencies:
+            return {}
+        to_ms = lambda seconds: round(seconds * 1000, 2)
+        if len(latencies) == 1:
+            cuts = latencies * 99
+        else:
+            cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        return {
+            "min": to_ms(latencies[0]),
+            "mean": to_ms(statistics.fmean(latencies)),
+            "p50": to_ms(cuts[49]),
+            "p95": to_ms(cuts[94]),
+            "p99": to_ms(cuts[98]),
+            "max": to_ms(latencies[-1]),
+        }
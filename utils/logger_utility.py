@@ -1,70 +1,163 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that freezes the message before enqueuing. It only runs for records whose
+    level is enabled, so %-style arguments are still formatted lazily, but on the calling
+    thread: arguments mutated after the call (lists, dicts, rows, parsed JSON) are logged as
+    they were. Tracebacks are rendered to text so their frames are not kept alive in the queue.
+    Timestamps, level prefixes and file output stay on the listener thread.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats each record as a single JSON object per line.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
 class LoggerUtility:
-    def __init__(self, log_dir="logs", log_level=logging.INFO):
+    def __init__(self, log_dir="logs", log_level=None, json_lines=None):
         """
         Initialize the LoggerUtility.
         Creates a log directory if it doesn't exist and sets up file and stream handlers.
-        Each log file is named with a timestamp to ensure uniqueness per execution.
+        Each process (xdist worker) gets its own log file and logger, named with a timestamp,
+        the worker id and the pid. Handlers run on a background listener thread fed by a queue,
+        so callers only pay for rendering the message and enqueuing the record.
+        Messages use logging's lazy %-style arguments and are only formatted if emitted.
+        Args:
+            log_dir (str): Directory for log files.
+            log_level (int | str, optional): Minimum level; defaults to $LOG_LEVEL or INFO.
+            json_lines (bool, optional): Also write a .jsonl file; defaults to $LOG_JSON == "1".
         """
         if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+            os.makedirs(log_dir, exist_ok=True)
+        if log_level is None:
+            log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+        if json_lines is None:
+            json_lines = os.environ.get("LOG_JSON") == "1"
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(log_dir, f"test_log_{timestamp}.log")
-        self.logger = logging.getLogger(f"Logger_{timestamp}")
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        run_id = f"{timestamp}_{worker}_{os.getpid()}"
+        log_file = os.path.join(log_dir, f"test_log_{run_id}.log")
+        self.logger = logging.getLogger(f"Logger_{run_id}")
         self.logger.setLevel(log_level)
         formatter = logging.Formatter('%(asctime)s | %(levelname)s  | %(funcName)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        handlers = [file_handler]
 
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        self.logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
+
+        if json_lines:
+            json_handler = logging.FileHandler(os.path.join(log_dir, f"test_log_{run_id}.jsonl"))
+            json_handler.setFormatter(JsonLinesFormatter(datefmt='%Y-%m-%dT%H:%M:%S'))
+            handlers.append(json_handler)
+
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_DeferredQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.close)
+
+    def is_enabled_for(self, level):
+        """
+        Check whether a level would be emitted, to guard building expensive log arguments.
+        Args:
+            level (int): A logging level, e.g. logging.DEBUG.
+        """
+        return self.logger.isEnabledFor(level)
 
-    def info(self, message):
+    def info(self, message, *args):
         """
         Log an info level message.
         Returns self for method chaining.
         """
-        self.logger.info(message)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, stacklevel=2)
         return self
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """
         Log a warning level message.
         Returns self for method chaining.
         """
-        self.logger.warning(message)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, stacklevel=2)
         return self
 
-    def error(self, message):
+    def error(self, message, *args):
         """
         Log an error level message.
         Returns self for method chaining.
         """
-        self.logger.error(message)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, *args, stacklevel=2)
         return self
 
-    def debug(self, message):
+    def debug(self, message, *args):
         """
         Log a debug level message.
         Returns self for method chaining.
         """
-        self.logger.debug(message)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, stacklevel=2)
         return self
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """
         Log a critical level message.
         Returns self for method chaining.
         """
-        self.logger.critical(message)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, *args, stacklevel=2)
         return self
 
+    def close(self):
+        """
+        Flush queued records and stop the listener thread.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
 # Mechanism to invoke logger at the start and end of execution
 logger = LoggerUtility()
 
@@ -80,4 +173,4 @@ def pytest_sessionfinish(session, exitstatus):
     Pytest hook: Called after whole test run finished, right before returning the exit status to the system.
     Logs the end of the test execution.
     """
-    logger.info("Test execution finished.")
\ No newline at end of file
+    logger.info("Test execution finished.")
@@ -0,0 +1,159 @@
+import glob
+import json
+import os
+import re
+import threading
+from utils.logger_utility import logger
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Named :params, but not the second colon of a PostgreSQL cast (c::int).
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|(?<!:):\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"(values\s*\(\?\))(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryProfilerUtility:
+    """
+    Opt-in profiler for DatabaseUtility statements. Records timing and row counts per
+    normalized query fingerprint (literals and placeholders replaced by '?'), keeps the
+    slowest individual executions and, above a threshold, the EXPLAIN plan of a fingerprint.
+    """
+
+    def __init__(self, output_dir=os.path.join("reports", "db_profile"), slow_threshold=0.5, explain=True, keep_slowest=20):
+        """
+        Initialize the profiler.
+        Args:
+            output_dir (str): Directory receiving one JSON file per process (xdist worker).
+            slow_threshold (float): Seconds above which an execution counts as slow.
+            explain (bool): Capture an EXPLAIN plan the first time a fingerprint runs slow (PostgreSQL).
+            keep_slowest (int): Number of slowest individual executions kept.
+        """
+        self.output_dir = output_dir
+        self.slow_threshold = slow_threshold
+        self.explain = explain
+        self.keep_slowest = keep_slowest
+        self.statements = {}
+        self.slowest = []
+        self.current_test = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(query):
+        """
+        Normalize a statement so executions differing only in literals or list lengths group together.
+        Args:
+            query (str): SQL text.
+        Returns:
+            str: Normalized, lower-cased statement.
+        """
+        normalized = _STRING_LITERAL.sub("?", query)
+        normalized = _PLACEHOLDER.sub("?", normalized)
+        normalized = _NUMBER_LITERAL.sub("?", normalized)
+        normalized = _WHITESPACE.sub(" ", normalized).strip().rstrip(";").lower()
+        normalized = _IN_LIST.sub("(?)", normalized)
+        return _VALUES_LIST.sub(r"\1", normalized)
+
+    def record(self, query, seconds, rows):
+        """
+        Record one executed statement.
+        Args:
+            query (str): SQL text as executed.
+            seconds (float): Execution time including fetching.
+            rows (int): Rows fetched or affected (-1 if unknown).
+        Returns:
+            bool: True if the fingerprint ran slow for the first time and has no plan yet.
+        """
+        fingerprint = self.fingerprint(query)
+        with self._lock:
+            stats = self.statements.setdefault(fingerprint, {
+                "count": 0, "seconds": 0.0, "max_seconds": 0.0, "rows": 0, "slow": 0,
+                "example": query[:2000], "tests": [], "plan": None,
+            })
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["rows"] += max(rows, 0)
+            if self.current_test and self.current_test not in stats["tests"] and len(stats["tests"]) < 10:
+                stats["tests"].append(self.current_test)
+            if seconds < self.slow_threshold:
+                return False
+            stats["slow"] += 1
+            self.slowest.append({"seconds": round(seconds, 4), "rows": rows, "statement": query[:2000],
+                                 "fingerprint": fingerprint, "test": self.current_test})
+            self.slowest.sort(key=lambda entry: entry["seconds"], reverse=True)
+            del self.slowest[self.keep_slowest:]
+            needs_plan = self.explain and stats["plan"] is None
+            if needs_plan:
+                stats["plan"] = []
+        logger.warning("Slow query (%.3fs, %s rows): %s", seconds, rows, fingerprint[:200])
+        return needs_plan
+
+    def attach_plan(self, query, plan):
+        """
+        Store an EXPLAIN plan for the statement's fingerprint.
+        Args:
+            query (str): SQL text the plan belongs to.
+            plan (list): Plan lines.
+        """
+        with self._lock:
+            stats = self.statements.get(self.fingerprint(query))
+            if stats is not None:
+                stats["plan"] = plan
+
+    def write(self, name):
+        """
+        Write this process's measurements as JSON.
+        Args:
+            name (str): File stem, typically the xdist worker id.
+        Returns:
+            str: Path of the written file.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{name}.json")
+        with open(path, "w") as f:
+            json.dump({"statements": self.statements, "slowest": self.slowest}, f, indent=2)
+        return path
+
+    @classmethod
+    def merge(cls, output_dir, keep_slowest=20):
+        """
+        Merge the per-process files found in output_dir.
+        Returns:
+            dict: {"statements": {fingerprint: stats}, "slowest": [...]} across all workers.
+        """
+        merged = {"statements": {}, "slowest": []}
+        for path in sorted(glob.glob(os.path.join(output_dir, "*.json"))):
+            with open(path) as f:
+                data = json.load(f)
+            for fingerprint, stats in data.get("statements", {}).items():
+                target = merged["statements"].setdefault(fingerprint, dict(stats, count=0, seconds=0.0,
+                                                                           max_seconds=0.0, rows=0, slow=0, tests=[]))
+                for key in ("count", "seconds", "rows", "slow"):
+                    target[key] += stats[key]
+                target["max_seconds"] = max(target["max_seconds"], stats["max_seconds"])
+                target["tests"] = (target["tests"] + [t for t in stats["tests"] if t not in target["tests"]])[:10]
+                target["plan"] = target.get("plan") or stats.get("plan")
+            merged["slowest"].extend(data.get("slowest", []))
+        merged["slowest"].sort(key=lambda entry: entry["seconds"], reverse=True)
+        del merged["slowest"][keep_slowest:]
+        return merged
+
+    @staticmethod
+    def format_table(merged, limit=10):
+        """
+        Render merged measurements as summary lines: most total time, then most frequent statements.
+        Returns:
+            list: Lines of text.
+        """
+        lines = []
+        statements = merged["statements"].items()
+        for title, key in (("by total time", lambda item: item[1]["seconds"]),
+                           ("by count", lambda item: item[1]["count"])):
+            lines.append(f"{'statement ' + title:<70} {'count':>7} {'total s':>9} {'max s':>8} {'rows':>9}")
+            for fingerprint, stats in sorted(statements, key=key, reverse=True)[:limit]:
+                lines.append(f"{fingerprint[:70]:<70} {stats['count']:>7} {stats['seconds']:>9.3f} "
+                             f"{stats['max_seconds']:>8.3f} {stats['rows']:>9}")
+            lines.append("")
+        return lines
@@ -0,0 +1,86 @@
+import functools
+import os
+import uuid
+import allure
+
+
+class ReportUtility:
+    """
+    Controls how much Allure instrumentation the utilities emit.
+
+    Levels:
+        off:      no steps, no attachments
+        failures: no steps, attachments only for failures
+        steps:    steps plus failure attachments (default)
+        full:     steps plus every attachment (e.g. all API responses)
+    """
+
+    LEVELS = {"off": 0, "failures": 1, "steps": 2, "full": 3}
+
+    level = LEVELS.get(os.environ.get("REPORT_LEVEL", "steps"), 2)
+    max_attachment_size = 64 * 1024
+    spill_dir = os.path.join("reports", "attachments")
+
+    @classmethod
+    def configure(cls, level=None, max_attachment_size=None, spill_dir=None):
+        """
+        Set the reporting level and attachment limits for this process.
+        Args:
+            level (str, optional): One of 'off', 'failures', 'steps', 'full'.
+            max_attachment_size (int, optional): Characters kept inline before an attachment is truncated.
+            spill_dir (str, optional): Directory for full bodies of truncated attachments.
+        """
+        if level is not None:
+            if level not in cls.LEVELS:
+                raise ValueError(f"Invalid report level: {level}. Use one of {list(cls.LEVELS)}.")
+            cls.level = cls.LEVELS[level]
+        if max_attachment_size is not None:
+            cls.max_attachment_size = max_attachment_size
+        if spill_dir is not None:
+            cls.spill_dir = spill_dir
+
+    @classmethod
+    def step(cls, title):
+        """
+        Decorator equivalent to allure.step, applied only when the level records steps.
+        Below that level the function is called directly, so the title is never formatted.
+        Args:
+            title (str): Step title template, formatted from the call's arguments.
+        """
+        def decorator(func):
+            stepped = allure.step(title)(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if cls.level >= cls.LEVELS["steps"]:
+                    return stepped(*args, **kwargs)
+                return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def attach(cls, body, name, attachment_type=allure.attachment_type.TEXT, failure=False):
+        """
+        Attach content to the report if the level allows it.
+        Bodies larger than max_attachment_size are truncated inline and written in full to a spill file.
+        Args:
+            body (str | callable): Content, or a zero-argument callable producing it (evaluated only if attached).
+            name (str): Attachment name.
+            attachment_type: Allure attachment type.
+            failure (bool): Whether the attachment describes a failure.
+        """
+        if cls.level == cls.LEVELS["off"]:
+            return
+        if not failure and cls.level < cls.LEVELS["full"]:
+            return
+        if callable(body):
+            body = body()
+        body = str(body)
+        if len(body) > cls.max_attachment_size:
+            os.makedirs(cls.spill_dir, exist_ok=True)
+            spill_path = os.path.join(cls.spill_dir, f"{uuid.uuid4().hex}.txt")
+            with open(spill_path, "w", encoding="utf-8") as f:
+                f.write(body)
+            body = (f"{body[:cls.max_attachment_size]}\n... truncated {len(body) - cls.max_attachment_size} "
+                    f"characters, full content in {spill_path}")
+        allure.attach(body, name=name, attachment_type=attachment_type)
@@ -0,0 +1,144 @@
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import threading
+from utils.logger_utility import logger
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_pillow_warning = threading.Event()
+
+
+def _warn_missing_pillow(image_format, max_width):
+    # Once per process: every worker would otherwise repeat it for each utility instance.
+    if not _pillow_warning.is_set():
+        _pillow_warning.set()
+        logger.warning("Pillow is not installed (see requirement.txt): screenshot format '%s' and max_width %s "
+                       "are ignored, storing original PNG.", image_format, max_width)
+
+
+class ScreenshotUtility:
+    """
+    Failure screenshot pipeline. The test thread only grabs the raw PNG bytes; encoding,
+    resizing, hashing and writing happen on a background writer thread.
+    Files are content-addressed (named by hash), so identical screenshots from different
+    parametrizations are stored once. index.jsonl maps test names to stored files.
+    """
+
+    EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+    def __init__(self, directory="screenshot", image_format="png", max_width=None, quality=80):
+        """
+        Initialize the screenshot pipeline.
+        Args:
+            directory (str): Directory for stored screenshots and the index.
+            image_format (str): 'png', 'jpeg' or 'webp'. Re-encoding requires Pillow.
+            max_width (int, optional): Downscale wider screenshots to this width (requires Pillow).
+            quality (int): Encoder quality for jpeg/webp.
+        """
+        image_format = (image_format or "png").lower()
+        if image_format not in self.EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+        if Image is None and (image_format != "png" or max_width):
+            _warn_missing_pillow(image_format, max_width)
+            image_format, max_width = "png", None
+        self.directory = directory
+        self.image_format = image_format
+        self.max_width = max_width
+        self.quality = quality
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def capture(self, driver, name):
+        """
+        Grab a screenshot and queue it for writing. Returns as soon as the bytes are received.
+        Args:
+            driver (WebDriver): Driver to capture.
+            name (str): Test name the screenshot belongs to.
+        """
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error("Failed to capture screenshot for %s: %s", name, e)
+            return
+        self._ensure_writer()
+        self._queue.put((name, png))
+
+    def close(self):
+        """
+        Flush queued screenshots and stop the writer thread.
+        """
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    @staticmethod
+    def sanitize_name(name, max_length=150):
+        """
+        Turn a test node name (including parametrize ids) into a safe file name stem.
+        Args:
+            name (str): Raw name.
+            max_length (int): Maximum length of the result.
+        Returns:
+            str: Name containing only letters, digits, '.', '_' and '-'.
+        """
+        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._")
+        return safe[:max_length] or "screenshot"
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            name, png = job
+            try:
+                self._store(name, png)
+            except Exception as e:
+                logger.error("Failed to write screenshot for %s: %s", name, e)
+
+    def _store(self, name, png):
+        digest = hashlib.sha256(png).hexdigest()[:20]
+        filename = f"{digest}.{self.EXTENSIONS[self.image_format]}"
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            data = self._encode(png)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            logger.info("Screenshot saved: %s (%s bytes)", path, len(data))
+        else:
+            logger.info("Screenshot for %s matches stored %s", name, path)
+        entry = json.dumps({"test": name, "file": filename, "safe_name": self.sanitize_name(name)})
+        with open(os.path.join(self.directory, "index.jsonl"), "a") as f:
+            f.write(entry + "\n")
+
+    def _encode(self, png):
+        if self.image_format == "png" and not self.max_width:
+            return png
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+        out = io.BytesIO()
+        if self.image_format == "png":
+            image.save(out, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(out, format=self.image_format.upper(), quality=self.quality)
+        return out.getvalue()
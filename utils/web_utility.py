@@ -3,87 +3,210 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
-import allure
+from utils.report_utility import ReportUtility
 from utils.logger_utility import logger
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
+import time
+
+
+# Resolves Selenium (by, value) locators inside the page. Batched queries and form filling
+# prepend it so locating and touching every element costs a single execute_script call.
+_LOCATE_JS = """
+function locate(by, value) {
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+        return found;
+    }
+    if (by === 'link text' || by === 'partial link text') {
+        return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+            var text = (a.innerText || '').trim();
+            return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+        });
+    }
+    var selector = {
+        'id': '[id="' + CSS.escape(value) + '"]',
+        'name': '[name="' + CSS.escape(value) + '"]',
+        'class name': '.' + CSS.escape(value),
+        'tag name': value,
+        'css selector': value
+    }[by];
+    return Array.prototype.slice.call(document.querySelectorAll(selector));
+}
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' &&
+        !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+"""
+
+_RESOLVE_JS = _LOCATE_JS + "var nodes = locate(arguments[0], arguments[1]);\n"
+
+# Sets every field through the native value setter and fires input/change events, so
+# framework-bound inputs see the change (checkboxes and radios are clicked, which fires
+# them natively), then optionally clicks the submit element.
+# Returns null (caller retries) until every target is present, visible and enabled.
+_FILL_FORM_JS = _LOCATE_JS + """
+var fields = arguments[0], submit = arguments[1], targets = [];
+function ready(el) { return el && isVisible(el) && !el.disabled; }
+for (var i = 0; i < fields.length; i++) {
+    var el = locate(fields[i][0], fields[i][1])[0];
+    if (!ready(el)) { return null; }
+    targets.push(el);
+}
+var submitEl = submit ? locate(submit[0], submit[1])[0] : null;
+if (submit && !ready(submitEl)) { return null; }
+targets.forEach(function (el, i) {
+    var value = fields[i][2];
+    el.focus();
+    if (el.type === 'checkbox' || el.type === 'radio') {
+        // click() toggles the state and fires input/change itself.
+        if (el.checked !== !!value) { el.click(); }
+    } else {
+        var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype :
+            el.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value == null ? '' : String(value));
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    el.blur();
+});
+if (submitEl) { submitEl.click(); }
+return true;
+"""
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    WebDriverWait with adaptive polling: the first polls are fast so conditions that are
+    already (or almost) met return quickly, then the interval backs off to limit the number
+    of driver round trips spent on slow conditions.
+    """
+
+    def __init__(self, driver, timeout, initial_poll=0.05, max_poll=0.5, backoff=1.5, ignored_exceptions=None):
+        super().__init__(driver, timeout, poll_frequency=initial_poll, ignored_exceptions=ignored_exceptions)
+        self._max_poll = max_poll
+        self._backoff = backoff
+
+    def until(self, method, message=""):
+        return self._poll_until(method, message, expected=True)
+
+    def until_not(self, method, message=""):
+        return self._poll_until(method, message, expected=False)
+
+    def _poll_until(self, method, message, expected):
+        screen = None
+        stacktrace = None
+        poll = self._poll
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if bool(value) == expected:
+                    return value if expected else True
+            except self._ignored_exceptions as exc:
+                if not expected:
+                    return True
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self._backoff, self._max_poll)
+        raise TimeoutException(message, screen, stacktrace)
 
 
 class WebUtility:
     def __init__(self, driver, timeout=10):
         """
         Initialize WebUtility with a Selenium WebDriver instance and optional timeout.
+        All waits go through a single AdaptiveWait engine; drivers must not use implicit waits.
+        Every waiting method accepts a per-call `timeout` override in seconds.
         """
         self.driver = driver
         self.timeout = timeout
 
-    @allure.step("Navigate to URL: {1}")
-    def go_to(self, url):
+    def wait(self, timeout=None):
+        """
+        Get a wait engine for this driver.
+        Args:
+            timeout (float, optional): Override for the default timeout.
+        Returns:
+            AdaptiveWait: Wait object with adaptive polling.
+        """
+        return AdaptiveWait(self.driver, self.timeout if timeout is None else timeout)
+
+    @ReportUtility.step("Navigate to URL: {1}")
+    def go_to(self, url, timeout=None):
         """
         Navigate to the specified URL and wait for the page to load.
         """
         try:
-            logger.info(f"Navigating to URL: {url}")
+            logger.info("Navigating to URL: %s", url)
             self.driver.get(url)
-            WebDriverWait(self.driver, self.timeout).until(
+            self.wait(timeout).until(
                 lambda d: d.execute_script('return document.readyState') == 'complete'
             )
         except Exception as e:
-            logger.error(f"Failed to navigate to URL {url}: {e}")
-            allure.attach(str(e), name="Navigation Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to navigate to URL %s: %s", url, e)
+            ReportUtility.attach(str(e), name="Navigation Error", failure=True)
             raise
         return self
 
-    @allure.step("Find element by {1}: {2}")
-    def find_element(self, locator):
+    @ReportUtility.step("Find element by {1}: {2}")
+    def find_element(self, locator, timeout=None):
         """
         Find a single element using the given locator strategy and value.
         """
         try:
-            logger.debug(f"Finding element by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Finding element by locator: %s", locator)
+            element = self.wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return element
         except Exception as e:
-            logger.error(f"Failed to find element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Find Element Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to find element by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Find Element Error", failure=True)
             raise
 
-    @allure.step("Find elements by locator: {locator}")
-    def find_elements(self, locator: tuple):
+    @ReportUtility.step("Find elements by locator: {locator}")
+    def find_elements(self, locator: tuple, timeout=None):
         """
         Find multiple elements using the given locator strategy and value.
         """
         try:
-            logger.debug(f"Finding elements by locator: {locator}")
-            elements = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Finding elements by locator: %s", locator)
+            elements = self.wait(timeout).until(
                 EC.presence_of_all_elements_located(locator)
             )
             return elements
         except Exception as e:
-            logger.error(f"Failed to find elements by locator: {locator} - {e}")
-            allure.attach(str(e), name="Find Elements Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to find elements by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Find Elements Error", failure=True)
             raise
 
-    @allure.step("Click element by locator: {locator}")
-    def click(self, locator: tuple):
+    @ReportUtility.step("Click element by locator: {locator}")
+    def click(self, locator: tuple, timeout=None):
         """
         Click on an element after waiting for it to be clickable.
         """
         try:
-            logger.info(f"Clicking element by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Clicking element by locator: %s", locator)
+            element = self.wait(timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             element.click()
         except Exception as e:
-            logger.error(f"Failed to click element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Click Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to click element by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Click Error", failure=True)
             raise
         return self
 
-    @allure.step("Send keys '{keys}' to element {locator}")
-    def send_keys(self, locator: tuple, keys: str):
+    @ReportUtility.step("Send keys '{keys}' to element {locator}")
+    def send_keys(self, locator: tuple, keys: str, timeout=None):
         """
         Send keys to an element after waiting for it to be visible.
 
@@ -91,104 +214,144 @@ class WebUtility:
         :param keys: String to type into the element
         """
         try:
-            logger.info(f"Sending keys '{keys}' to element located by {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Sending keys '%s' to element located by %s", keys, locator)
+            element = self.wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             element.clear()
             element.send_keys(keys)
         except Exception as e:
-            logger.error(f"Failed to send keys to element {locator} - {e}")
-            allure.attach(str(e), name="Send Keys Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to send keys to element %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Send Keys Error", failure=True)
             raise
         return self
 
-    @allure.step("Get text from element by {locator}")
-    def get_text(self, locator: tuple):
+    @ReportUtility.step("Get text from element by {locator}")
+    def get_text(self, locator: tuple, timeout=None):
         """
         Get the text of an element after waiting for it to be visible.
         """
         try:
-            logger.debug(f"Getting text from element by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Getting text from element by locator: %s", locator)
+            element = self.wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             text = element.text
-            logger.info(f"Text found: {text}")
+            logger.info("Text found: %s", text)
             return text
         except Exception as e:
-            logger.error(f"Failed to get text from element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Get Text Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to get text from element by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Get Text Error", failure=True)
             raise
 
-    @allure.step("Wait for element to be clickable by locator: {locator}")
-    def wait_for_clickable(self, locator: tuple):
+    @ReportUtility.step("Wait for element to be clickable by locator: {locator}")
+    def wait_for_clickable(self, locator: tuple, timeout=None):
         """
         Wait for an element to be clickable and return it.
         """
         try:
-            logger.debug(f"Waiting for element to be clickable by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Waiting for element to be clickable by locator: %s", locator)
+            element = self.wait(timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             return element
         except Exception as e:
-            logger.error(f"Element not clickable by locator: {locator} - {e}")
-            allure.attach(str(e), name="Wait Clickable Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Element not clickable by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Wait Clickable Error", failure=True)
             raise
 
-    @allure.step("Check if element is visible by locator: {locator}")
-    def is_visible(self, locator: tuple):
+    @ReportUtility.step("Check if element is visible by locator: {locator}")
+    def is_visible(self, locator: tuple, timeout=None):
         """
-        Check if an element is visible on the page.
+        Check if an element is visible on the page, waiting up to the timeout.
+        Pass timeout=0 for an immediate check.
         """
         try:
-            logger.debug(f"Checking visibility for element by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Checking visibility for element by locator: %s", locator)
+            element = self.wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             logger.info("Element is visible.")
             return True
+        except TimeoutException as e:
+            # A negative result, not an error: only recorded at the 'full' report level.
+            logger.warning("Element not visible by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Visibility Check")
+            return False
         except Exception as e:
-            logger.warning(f"Element not visible by locator: {locator} - {e}")
-            allure.attach(str(e), name="Visibility Error", attachment_type=allure.attachment_type.TEXT)
+            logger.warning("Element not visible by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Visibility Error", failure=True)
             return False
 
-    @allure.step("Get attribute '{2}' from element by locator: {locator}")
-    def get_attribute(self, locator: tuple, attribute):
+    @ReportUtility.step("Check if element is absent by locator: {locator}")
+    def is_absent(self, locator: tuple, timeout=None):
+        """
+        Check that no element matches the locator.
+        Returns True immediately if nothing matches; otherwise waits up to the timeout
+        for matching elements to disappear.
+        """
+        try:
+            logger.debug("Checking absence of element by locator: %s", locator)
+            self.wait(timeout).until_not(lambda d: d.find_elements(*locator))
+            logger.info("Element is absent.")
+            return True
+        except TimeoutException as e:
+            logger.warning("Element still present by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Absence Check")
+            return False
+
+    @ReportUtility.step("Check if element is not visible by locator: {locator}")
+    def is_not_visible(self, locator: tuple, timeout=None):
+        """
+        Check that an element is hidden or not present.
+        Returns True immediately if it is already hidden or absent; otherwise waits up to
+        the timeout for it to become invisible.
+        """
+        try:
+            logger.debug("Checking invisibility for element by locator: %s", locator)
+            self.wait(timeout).until(EC.invisibility_of_element_located(locator))
+            logger.info("Element is not visible.")
+            return True
+        except TimeoutException as e:
+            logger.warning("Element still visible by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Invisibility Check")
+            return False
+
+    @ReportUtility.step("Get attribute '{2}' from element by locator: {locator}")
+    def get_attribute(self, locator: tuple, attribute, timeout=None):
         """
         Get the value of an attribute from an element.
         """
         try:
-            logger.debug(f"Getting attribute '{attribute}' from element by locator: {locator}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.debug("Getting attribute '%s' from element by locator: %s", attribute, locator)
+            element = self.wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             attr_value = element.get_attribute(attribute)
-            logger.info(f"Attribute value: {attr_value}")
+            logger.info("Attribute value: %s", attr_value)
             return attr_value
         except Exception as e:
-            logger.error(f"Failed to get attribute '{attribute}' from element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Get Attribute Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to get attribute '%s' from element by locator: %s - %s", attribute, locator, e)
+            ReportUtility.attach(str(e), name="Get Attribute Error", failure=True)
             raise
 
-    @allure.step("Switch to frame by locator: {locator}")
-    def switch_to_frame(self, locator: tuple):
+    @ReportUtility.step("Switch to frame by locator: {locator}")
+    def switch_to_frame(self, locator: tuple, timeout=None):
         """
         Switch to a frame using the given locator.
         """
         try:
-            logger.info(f"Switching to frame by locator: {locator}")
-            frame = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Switching to frame by locator: %s", locator)
+            frame = self.wait(timeout).until(
                 EC.frame_to_be_available_and_switch_to_it(locator)
             )
         except Exception as e:
-            logger.error(f"Failed to switch to frame by locator: {locator} - {e}")
-            allure.attach(str(e), name="Switch Frame Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to switch to frame by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Switch Frame Error", failure=True)
             raise
         return self
 
-    @allure.step("Switch to default content")
+    @ReportUtility.step("Switch to default content")
     def switch_to_default_content(self):
         """
         Switch to the default content from any frame.
@@ -197,59 +360,59 @@ class WebUtility:
             logger.info("Switching to default content")
             self.driver.switch_to.default_content()
         except Exception as e:
-            logger.error(f"Failed to switch to default content - {e}")
-            allure.attach(str(e), name="Switch Default Content Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to switch to default content - %s", e)
+            ReportUtility.attach(str(e), name="Switch Default Content Error", failure=True)
             raise
         return self
 
-    @allure.step("Accept alert")
-    def accept_alert(self):
+    @ReportUtility.step("Accept alert")
+    def accept_alert(self, timeout=None):
         """
         Accept a browser alert if present.
         """
         try:
             logger.info("Accepting alert")
-            WebDriverWait(self.driver, self.timeout).until(EC.alert_is_present())
+            self.wait(timeout).until(EC.alert_is_present())
             self.driver.switch_to.alert.accept()
         except Exception as e:
-            logger.error(f"Failed to accept alert - {e}")
-            allure.attach(str(e), name="Accept Alert Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to accept alert - %s", e)
+            ReportUtility.attach(str(e), name="Accept Alert Error", failure=True)
             raise
         return self
 
-    @allure.step("Dismiss alert")
-    def dismiss_alert(self):
+    @ReportUtility.step("Dismiss alert")
+    def dismiss_alert(self, timeout=None):
         """
         Dismiss a browser alert if present.
         """
         try:
             logger.info("Dismissing alert")
-            WebDriverWait(self.driver, self.timeout).until(EC.alert_is_present())
+            self.wait(timeout).until(EC.alert_is_present())
             self.driver.switch_to.alert.dismiss()
         except Exception as e:
-            logger.error(f"Failed to dismiss alert - {e}")
-            allure.attach(str(e), name="Dismiss Alert Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to dismiss alert - %s", e)
+            ReportUtility.attach(str(e), name="Dismiss Alert Error", failure=True)
             raise
         return self
 
-    @allure.step("Refresh page")
-    def refresh(self):
+    @ReportUtility.step("Refresh page")
+    def refresh(self, timeout=None):
         """
         Refresh the current page and wait for it to load.
         """
         try:
             logger.info("Refreshing page")
             self.driver.refresh()
-            WebDriverWait(self.driver, self.timeout).until(
+            self.wait(timeout).until(
                 lambda d: d.execute_script('return document.readyState') == 'complete'
             )
         except Exception as e:
-            logger.error(f"Failed to refresh page - {e}")
-            allure.attach(str(e), name="Refresh Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to refresh page - %s", e)
+            ReportUtility.attach(str(e), name="Refresh Error", failure=True)
             raise
         return self
 
-    @allure.step("Perform action chain")
+    @ReportUtility.step("Perform action chain")
     def perform_action_chain(self, actions_callback):
         """
         Perform a custom ActionChains sequence using the provided callback.
@@ -261,19 +424,19 @@ class WebUtility:
             actions_callback(actions)
             actions.perform()
         except Exception as e:
-            logger.error(f"Failed to perform action chain - {e}")
-            allure.attach(str(e), name="Action Chain Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to perform action chain - %s", e)
+            ReportUtility.attach(str(e), name="Action Chain Error", failure=True)
             raise
         return self
 
-    @allure.step("Select option in dropdown by {1}: {2} using {3}='{4}'")
-    def select_dropdown(self, by, value, select_by="value", option=""):
+    @ReportUtility.step("Select option in dropdown by {1}: {2} using {3}='{4}'")
+    def select_dropdown(self, by, value, select_by="value", option="", timeout=None):
         """
         Select an option in a dropdown using value, visible text, or index.
         """
         try:
-            logger.info(f"Selecting dropdown option by {by}: {value} using {select_by}='{option}'")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Selecting dropdown option by %s: %s using %s='%s'", by, value, select_by, option)
+            element = self.wait(timeout).until(
                 EC.element_to_be_clickable((by, value))
             )
             select = Select(element)
@@ -286,76 +449,213 @@ class WebUtility:
             else:
                 raise ValueError(f"Invalid select_by: {select_by}")
         except Exception as e:
-            logger.error(f"Failed to select dropdown option by {by}: {value} - {e}")
-            allure.attach(str(e), name="Select Dropdown Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to select dropdown option by %s: %s - %s", by, value, e)
+            ReportUtility.attach(str(e), name="Select Dropdown Error", failure=True)
             raise
         return self
 
-    @allure.step("Context click (right click) on element by {1}: {2}")
-    def context_click(self, by, value):
+    @ReportUtility.step("Context click (right click) on element by {1}: {2}")
+    def context_click(self, by, value, timeout=None):
         """
         Perform a context (right) click on the specified element.
         """
         try:
-            logger.info(f"Performing context click on element by {by}: {value}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Performing context click on element by %s: %s", by, value)
+            element = self.wait(timeout).until(
                 EC.visibility_of_element_located((by, value))
             )
             actions = ActionChains(self.driver)
             actions.context_click(element).perform()
         except Exception as e:
-            logger.error(f"Failed to context click on element by {by}: {value} - {e}")
-            allure.attach(str(e), name="Context Click Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to context click on element by %s: %s - %s", by, value, e)
+            ReportUtility.attach(str(e), name="Context Click Error", failure=True)
             raise
         return self
 
-    @allure.step("Mouse hover on element by {1}: {2}")
-    def mouse_hover(self, by, value):
+    @ReportUtility.step("Mouse hover on element by {1}: {2}")
+    def mouse_hover(self, by, value, timeout=None):
         """
         Perform a mouse hover over the specified element.
         """
         try:
-            logger.info(f"Performing mouse hover on element by {by}: {value}")
-            element = WebDriverWait(self.driver, self.timeout).until(
+            logger.info("Performing mouse hover on element by %s: %s", by, value)
+            element = self.wait(timeout).until(
                 EC.visibility_of_element_located((by, value))
             )
             actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
         except Exception as e:
-            logger.error(f"Failed to mouse hover on element by {by}: {value} - {e}")
-            allure.attach(str(e), name="Mouse Hover Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to mouse hover on element by %s: %s - %s", by, value, e)
+            ReportUtility.attach(str(e), name="Mouse Hover Error", failure=True)
             raise
         return self
     
 
-    @allure.step("Get text from multiple elements by {1}: {2}")
+    @ReportUtility.step("Get text from multiple elements by {1}: {2}")
     def get_text_elements(self, element):
         """
         Get text from multiple elements located by the given locator.
         Returns a list of text values.
         """
         try:
-            logger.debug(f"Getting text from element: {element}")
+            logger.debug("Getting text from element: %s", element)
             text = element.text
-            logger.info(f"Texts found: {text}")
+            logger.info("Texts found: %s", text)
             return text
         except Exception as e:
-            logger.error(f"Failed to get text from element: {element} - {e}")
-            allure.attach(str(e), name="Get Text Elements Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to get text from element: %s - %s", element, e)
+            ReportUtility.attach(str(e), name="Get Text Elements Error", failure=True)
             raise
 
-    @allure.step("Submit form for element by locator: {locator}")
+    def _query_all(self, locator: tuple, body: str, *args, timeout=None, require_match=True):
+        """
+        Resolve a locator and evaluate `body` over the matched `nodes` in one execute_script call.
+        With require_match, polls (via the wait engine) until at least one element matches.
+        """
+        by, value = locator
+        script = _RESOLVE_JS + body
+        if not require_match:
+            return self.driver.execute_script(script, by, value, *args)
+        return self.wait(timeout).until(
+            lambda d: d.execute_script(script, by, value, *args) or False,
+            message=f"No elements found by locator: {locator}",
+        )
+
+    @ReportUtility.step("Get texts of all elements by locator: {locator}")
+    def get_texts(self, locator: tuple, timeout=None):
+        """
+        Get the visible text of every element matching the locator in a single round trip.
+        Waits until at least one element is present.
+        Returns:
+            list: Text of each element, in document order.
+        """
+        try:
+            logger.debug("Getting texts from elements by locator: %s", locator)
+            texts = self._query_all(
+                locator,
+                "return nodes.length ? nodes.map(function (el) { return (el.innerText || '').trim(); }) : null;",
+                timeout=timeout,
+            )
+            logger.info("Texts found (%s): %s", len(texts), texts)
+            return texts
+        except Exception as e:
+            logger.error("Failed to get texts from elements by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Get Texts Error", failure=True)
+            raise
+
+    @ReportUtility.step("Get attribute '{attribute}' of all elements by locator: {locator}")
+    def get_attributes(self, locator: tuple, attribute, timeout=None):
+        """
+        Get an attribute (or DOM property) of every element matching the locator in a single round trip.
+        Waits until at least one element is present.
+        Returns:
+            list: Attribute value of each element, None where it is not set.
+        """
+        try:
+            logger.debug("Getting attribute '%s' from elements by locator: %s", attribute, locator)
+            values = self._query_all(
+                locator,
+                """
+                var name = arguments[2];
+                return nodes.length ? nodes.map(function (el) {
+                    var prop = el[name];
+                    if (prop === undefined || prop === null || typeof prop === 'object' || typeof prop === 'function') {
+                        return el.getAttribute(name);
+                    }
+                    return prop;
+                }) : null;
+                """,
+                attribute,
+                timeout=timeout,
+            )
+            logger.info("Attribute values (%s): %s", len(values), values)
+            return values
+        except Exception as e:
+            logger.error("Failed to get attribute '%s' from elements by locator: %s - %s", attribute, locator, e)
+            ReportUtility.attach(str(e), name="Get Attributes Error", failure=True)
+            raise
+
+    @ReportUtility.step("Check visibility of all elements by locator: {locator}")
+    def are_visible(self, locator: tuple):
+        """
+        Get the visibility of every element matching the locator in a single round trip, without waiting.
+        Returns:
+            list: True/False per element; empty if nothing matches.
+        """
+        try:
+            logger.debug("Checking visibility of elements by locator: %s", locator)
+            visible = self._query_all(locator, "return nodes.map(isVisible);", require_match=False)
+            logger.info("Visible elements: %s of %s", sum(visible), len(visible))
+            return visible
+        except Exception as e:
+            logger.error("Failed to check visibility of elements by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Are Visible Error", failure=True)
+            raise
+
+    @ReportUtility.step("Count elements by locator: {locator}")
+    def count(self, locator: tuple):
+        """
+        Count the elements matching the locator in a single round trip, without waiting.
+        Returns:
+            int: Number of matching elements.
+        """
+        try:
+            logger.debug("Counting elements by locator: %s", locator)
+            total = self._query_all(locator, "return nodes.length;", require_match=False)
+            logger.info("Elements found: %s", total)
+            return total
+        except Exception as e:
+            logger.error("Failed to count elements by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Count Error", failure=True)
+            raise
+
+    @ReportUtility.step("Fill form fields: {fields}")
+    def fill_form(self, fields: dict, submit: tuple = None, keystroke_locators=(), timeout=None):
+        """
+        Fill several form fields, and optionally submit, in as few driver commands as possible.
+        Fields are set through a single script that fires input/change events; it is retried
+        by the wait engine until every field (and the submit element) is visible and enabled.
+
+        :param fields: Mapping of locator tuple to value (bool for checkboxes/radios)
+        :param submit: Optional locator of the element to click after filling
+        :param keystroke_locators: Locators that must receive real keystrokes via send_keys
+            (e.g. inputs with key handlers); they are typed after the scripted fields
+        :param timeout: Optional override for the wait timeout
+        """
+        try:
+            logger.info("Filling form fields: %s | submit=%s", list(fields), submit)
+            keystroke_locators = set(keystroke_locators)
+            scripted = [[by, value, text] for (by, value), text in fields.items()
+                        if (by, value) not in keystroke_locators]
+            typed = [(locator, text) for locator, text in fields.items() if locator in keystroke_locators]
+            scripted_submit = list(submit) if submit and not typed else None
+            if scripted or scripted_submit:
+                self.wait(timeout).until(
+                    lambda d: d.execute_script(_FILL_FORM_JS, scripted, scripted_submit),
+                    message="Form fields were not ready to be filled",
+                )
+            for locator, text in typed:
+                self.send_keys(locator, text, timeout=timeout)
+            if submit and typed:
+                self.click(submit, timeout=timeout)
+        except Exception as e:
+            logger.error("Failed to fill form fields %s - %s", list(fields), e)
+            ReportUtility.attach(str(e), name="Fill Form Error", failure=True)
+            raise
+        return self
+
+    @ReportUtility.step("Submit form for element by locator: {locator}")
     def submit(self, locator: tuple):
         """
         Submit a form by sending the ENTER key to the specified element.
         """
         try:
-            logger.info(f"Submitting form for element by locator: {locator}")
+            logger.info("Submitting form for element by locator: %s", locator)
             element = self.find_element(locator)
             element.send_keys("\n")  # Simulate pressing Enter
         except Exception as e:
-            logger.error(f"Failed to submit form for element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Submit Form Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to submit form for element by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Submit Form Error", failure=True)
             raise
         return self
     
@@ -364,10 +664,10 @@ class WebUtility:
         Send keys to an element and then submit the form.
         """
         try:
-            logger.info(f"Sending keys and submitting for element by locator: {locator}")
+            logger.info("Sending keys and submitting for element by locator: %s", locator)
             self.send_keys(locator, keys + Keys.ENTER)
         except Exception as e:
-            logger.error(f"Failed to send keys and submit for element by locator: {locator} - {e}")
-            allure.attach(str(e), name="Send Keys and Enter Error", attachment_type=allure.attachment_type.TEXT)
+            logger.error("Failed to send keys and submit for element by locator: %s - %s", locator, e)
+            ReportUtility.attach(str(e), name="Send Keys and Enter Error", failure=True)
             raise
         return self
\ No newline at end of file